@@ -16,7 +16,7 @@ PRONOUN = "pronoun"
 NUMERAL = "numeral"
 PREPOSITION = "preposition"
 CONJUNCTION = "conjunction"
-LEXICAL_VALUES = {
+LEXICAL_VALUES = frozenset({
     NOUN,
     VERB,
     ADJECTIVE,
@@ -26,7 +26,7 @@ LEXICAL_VALUES = {
     NUMERAL,
     PREPOSITION,
     CONJUNCTION,
-}
+})
 
 # Lexical features
 GENDER = "gender"
@@ -37,7 +37,7 @@ VOICE = "voice"
 MOOD = "mood"
 PERSON = "person"
 TYPE = "type"
-LEXICAL_FEATURES = {GENDER, NUMBER, CASE, TENSE, VOICE, MOOD, PERSON, TYPE}
+LEXICAL_FEATURES = frozenset({GENDER, NUMBER, CASE, TENSE, VOICE, MOOD, PERSON, TYPE})
 
 
 
@@ -50,7 +50,7 @@ POSSESSIVE = "possessive"
 RELATIVE = "relative"
 DEFINITE = "definite"
 INDEFINITE = "indefinite"
-PRONOUN_TYPES = {
+PRONOUN_TYPES = frozenset({
     PERSONAL_STRONG,
     PERSONAL_WEAK,
     DEMONSTRATIVE,
@@ -59,27 +59,27 @@ PRONOUN_TYPES = {
     RELATIVE,
     # DEFINITE,
     INDEFINITE,
-}
+})
 
 # Gender constants (MGI abbreviations)
 MASCULINE = "masc"
 FEMININE = "fem"
 NEUTER = "neut"
 GENDER_WILDCARD = f"*{GENDER}*"  # Wildcard for random gender selection
-GENDER_VALUES = {MASCULINE, FEMININE, NEUTER, GENDER_WILDCARD}
+GENDER_VALUES = frozenset({MASCULINE, FEMININE, NEUTER, GENDER_WILDCARD})
 
 # Number constants (MGI abbreviations)
 SINGULAR = "sg"
 PLURAL = "pl"
 NUMBER_WILDCARD = f"*{NUMBER}*"  # Wildcard for random number selection
-NUMBER_VALUES = {SINGULAR, PLURAL, NUMBER_WILDCARD}
+NUMBER_VALUES = frozenset({SINGULAR, PLURAL, NUMBER_WILDCARD})
 
 # Case constants (MGI abbreviations)
 NOMINATIVE = "nom"
 ACCUSATIVE = "acc"
 GENITIVE = "gen"
 VOCATIVE = "voc"
-CASE_VALUES = {NOMINATIVE, ACCUSATIVE, GENITIVE, VOCATIVE}
+CASE_VALUES = frozenset({NOMINATIVE, ACCUSATIVE, GENITIVE, VOCATIVE})
 
 # Tense constants (MGI full names)
 PRESENT = "present"
@@ -87,30 +87,37 @@ AORIST = "aorist"
 PARATATIKOS = "paratatikos"
 FUTURE = "future c"
 FUTURE_SIMPLE = "future s"
-TENSE_VALUES = {PRESENT, AORIST, PARATATIKOS}
+TENSE_VALUES = frozenset({PRESENT, AORIST, PARATATIKOS})
 
 # Voice constants (MGI full names)
 ACTIVE = "active"
 PASSIVE = "passive"
-VOICE_VALUES = {ACTIVE, PASSIVE}
+VOICE_VALUES = frozenset({ACTIVE, PASSIVE})
 
 # Mood constants (MGI abbreviations)
 INDICATIVE = "ind"
 IMPERATIVE = "imp"
-MOOD_VALUES = {INDICATIVE, IMPERATIVE}
+MOOD_VALUES = frozenset({INDICATIVE, IMPERATIVE})
 
 # Person constants (MGI abbreviations)
 FIRST = "pri"
 SECOND = "sec"
 THIRD = "ter"
 PERSON_WILDCARD = f"*{PERSON}*"
-PERSON_VALUES = {FIRST, SECOND, THIRD, PERSON_WILDCARD}
+PERSON_VALUES = frozenset({FIRST, SECOND, THIRD, PERSON_WILDCARD})
 
 # Aspect constants (MGI abbreviations)
 PERFECT = "perf"
 IMPERFECT = "imperf"
 
-WILDCARD_FEATURES = {GENDER_WILDCARD, NUMBER_WILDCARD, PERSON_WILDCARD}
+WILDCARD_FEATURES = frozenset({GENDER_WILDCARD, NUMBER_WILDCARD, PERSON_WILDCARD})
+
+# Concrete values a wildcard may resolve to, keyed by feature category
+WILDCARD_CHOICES = {
+    GENDER: (MASCULINE, FEMININE, NEUTER),
+    NUMBER: (SINGULAR, PLURAL),
+    PERSON: (FIRST, SECOND, THIRD),
+}
 
 # Feature category mappings from design document
 FEATURE_CATEGORIES = {
@@ -155,15 +162,15 @@ FEATURE_CATEGORIES = {
 }
 
 VALID_CASE_FEATURES = {
-    NOUN:      {NUMBER, CASE, GENDER,                                  },
-    ADJECTIVE: {NUMBER, CASE, GENDER,                                  },
-    ARTICLE:   {NUMBER, CASE, GENDER,                                  },
-    PRONOUN:   {NUMBER, CASE, GENDER, PERSON, TYPE,                    },
-    VERB:      {NUMBER, CASE,         PERSON,       TENSE, VOICE, MOOD,},
+    NOUN:      frozenset({NUMBER, CASE, GENDER,                                  }),
+    ADJECTIVE: frozenset({NUMBER, CASE, GENDER,                                  }),
+    ARTICLE:   frozenset({NUMBER, CASE, GENDER,                                  }),
+    PRONOUN:   frozenset({NUMBER, CASE, GENDER, PERSON, TYPE,                    }),
+    VERB:      frozenset({NUMBER, CASE,         PERSON,       TENSE, VOICE, MOOD,}),
 
-    ADVERB:      set(),
-    PREPOSITION: set(),
-    CONJUNCTION: set(),
+    ADVERB:      frozenset(),
+    PREPOSITION: frozenset(),
+    CONJUNCTION: frozenset(),
 }
 
 
@@ -191,19 +198,12 @@ TABLE_ADVERB = "greek_adverbs"
 TABLE_PREPOSITION = "greek_prepositions"
 TABLE_CONJUNCTION = "greek_conjunctions"
 
-LEXICAL_TO_TABLE_MAP = {
-    NOUN: TABLE_NOUN,
-    VERB: TABLE_VERB,
-    ADJECTIVE: TABLE_ADJECTIVE,
-    ARTICLE: TABLE_ARTICLE,
-    PRONOUN: TABLE_PRONOUN,
-    ADVERB: TABLE_ADVERB,
-    PREPOSITION: TABLE_PREPOSITION,
-    CONJUNCTION: TABLE_CONJUNCTION,
-}
-
 VALIDATION_STATUS = "validation_status"
 
+# Values of the validation_status column, stored as small integers
+VALIDATION_VALID = 0
+VALIDATION_INVALID = 1
+
 _table = "table"
 _fields = "fields"
 
@@ -259,3 +259,8 @@ LEXICAL_CONFIG = {
         _fields: [LEMMA, VALIDATION_STATUS],
     },
 }
+
+# Derived from LEXICAL_CONFIG so table names are defined in one place
+LEXICAL_TO_TABLE_MAP = {
+    lexical: config[_table] for lexical, config in LEXICAL_CONFIG.items()
+}
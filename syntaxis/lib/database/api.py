@@ -1,7 +1,14 @@
+import copy
 import logging
+import random
 import sqlite3
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 from time import time
-from typing import Any
+from typing import Any, Iterable, Iterator, Sequence
 
 from syntaxis.lib import constants as c
 from syntaxis.lib.logging import log_calls
@@ -12,6 +19,217 @@ from .schema import create_schema
 
 logger = logging.getLogger(__name__)
 
+# Number of buffered greek_* rows per lexical before add_words flushes them.
+BULK_BATCH_SIZE = 5000
+
+# Size of sqlite3's per-connection prepared statement cache. Reused SQL strings
+# skip parsing and planning as long as they stay in this cache.
+CACHED_STATEMENTS = 512
+
+# Bound parameters per statement. 999 is SQLite's historical compile-time
+# default for SQLITE_MAX_VARIABLE_NUMBER, so multi-row inserts stay under it.
+MAX_SQL_VARIABLES = 999
+
+# Pragmas applied to every connection. NORMAL sync only fsyncs at WAL
+# checkpoints. Foreign keys are off by default on every new connection, so
+# translation links need them enabled.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Pragmas applied to file databases only. page_size only takes effect on a new
+# file, so it must run before WAL is enabled; mmap lets reads skip the copy
+# into SQLite's page cache, and a 64 MiB page cache keeps the lexicon resident.
+# In-memory databases keep every page resident anyway.
+FILE_PRAGMAS = (
+    "PRAGMA page_size=8192",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Pragmas used by bulk_mode for one-shot loads, trading durability for speed.
+# The journal mode is left alone: leaving WAL needs an exclusive lock, which
+# fails while any other connection (e.g. the API service) is open.
+BULK_PRAGMAS = ("PRAGMA synchronous=OFF",)
+
+# Fixed SQL, built once at import so every call hands sqlite3 the same string
+# and hits its statement cache.
+INSERT_ENGLISH_WORD_SQL = (
+    "INSERT OR IGNORE INTO english_words (word, lexical) VALUES (?, ?)"
+)
+# Links a lemma to one English word, resolving its id inside SQLite. Run once
+# per word so translation ids (and so read-back order) follow input order.
+LINK_TRANSLATION_SQL = (
+    "INSERT OR IGNORE INTO translations "
+    "(english_word_id, greek_lemma, greek_lexical) "
+    "SELECT id, ?, ? FROM english_words WHERE word = ? AND lexical = ?"
+)
+# Translations of many words; filled with one (?, ?) row per (lexical, lemma).
+# Joining a VALUES list lets each word probe ix_translations_greek, where a
+# row-value IN (VALUES ...) filter makes SQLite scan the whole table.
+FETCH_TRANSLATIONS_SQL = """
+    WITH w(lexical, lemma) AS (VALUES {})
+    SELECT t.greek_lexical, t.greek_lemma, e.word
+    FROM w
+    JOIN translations t ON t.greek_lemma = w.lemma AND t.greek_lexical = w.lexical
+    JOIN english_words e ON e.id = t.english_word_id
+    ORDER BY t.id
+"""
+WORDS_BY_ENGLISH_SQL = """
+    SELECT DISTINCT t.greek_lexical, t.greek_lemma
+    FROM english_words e
+    JOIN translations t ON t.english_word_id = e.id
+    WHERE e.word = ? AND (? IS NULL OR t.greek_lexical = ?)
+    ORDER BY t.greek_lexical, t.greek_lemma
+"""
+COUNT_TOTAL_WORDS_SQL = "SELECT " + " + ".join(
+    f"(SELECT COUNT(*) FROM {table})" for table in c.LEXICAL_TO_TABLE_MAP.values()
+)
+# Per-lexical lookup of one word by lemma
+LEMMA_EXISTS_SQL = {
+    lexical: f"SELECT id FROM {table} WHERE lemma = ?"
+    for lexical, table in c.LEXICAL_TO_TABLE_MAP.items()
+}
+# Number of (lemma, lexical) inflection results kept by _inflect
+INFLECTION_CACHE_SIZE = 4096
+
+
+# Shared fallback for lexicals without filterable features
+_NO_FEATURES: frozenset[str] = frozenset()
+
+
+@lru_cache(maxsize=None)
+def _in_list_sql(template: str, count: int, group: str = "?") -> str:
+    """Fill a statement's IN list with ``count`` placeholder groups.
+
+    Memoized so each list length formats the same SQL text once and keeps
+    hitting sqlite3's statement cache.
+
+    Args:
+        template: Statement with a single ``{}`` for the IN list
+        count: Number of placeholder groups
+        group: Placeholder group, e.g. ``"(?, ?)"`` for row values
+    """
+    return template.format(", ".join([group] * count))
+
+
+@lru_cache(maxsize=None)
+def _row_layout(lexical: str) -> tuple[tuple[Any, ...], dict[str, int]]:
+    """Return a lexical's template INSERT row and its field positions.
+
+    Args:
+        lexical: Part of speech
+
+    Returns:
+        Tuple of the row with defaults filled in and a field-to-index map
+    """
+    fields = c.LEXICAL_CONFIG[lexical]["fields"]
+    positions = {field: index for index, field in enumerate(fields)}
+    template: list[Any] = [None] * len(fields)
+    if "validation_status" in positions:
+        template[positions["validation_status"]] = c.VALIDATION_VALID
+    return tuple(template), positions
+
+
+@lru_cache(maxsize=None)
+def _insert_sql(
+    table: str, columns: tuple[str, ...], row_count: int, or_ignore: bool
+) -> str:
+    """Return an INSERT statement adding ``row_count`` rows per execution.
+
+    Memoized so every insert of the same shape reuses the same SQL text and
+    hits sqlite3's statement cache.
+
+    Args:
+        table: Table to insert into
+        columns: Column names, in the order of each row's values
+        row_count: Number of rows inserted by one execution of the statement
+        or_ignore: Whether to skip rows violating a UNIQUE constraint
+    """
+    verb = "INSERT OR IGNORE" if or_ignore else "INSERT"
+    names = ", ".join(f'"{column}"' for column in columns)
+    row = "(" + ", ".join(["?"] * len(columns)) + ")"
+    return f"{verb} INTO {table} ({names}) VALUES {', '.join([row] * row_count)}"
+
+
+def insert_rows(
+    cursor: sqlite3.Cursor,
+    table: str,
+    columns: tuple[str, ...],
+    rows: Sequence[Sequence[Any]],
+    or_ignore: bool = False,
+) -> int:
+    """Insert rows, packed into multi-row INSERT statements.
+
+    Each statement holds as many rows as fit in MAX_SQL_VARIABLES parameters.
+    The remainder goes through executemany with the single-row statement, so
+    only two statement shapes per table reach sqlite3's statement cache.
+
+    Args:
+        cursor: Cursor to execute the inserts on
+        table: Table to insert into
+        columns: Column names, in the order of each row's values
+        rows: Rows to insert
+        or_ignore: Whether to skip rows violating a UNIQUE constraint
+
+    Returns:
+        Number of rows inserted
+    """
+    chunk_size = max(1, MAX_SQL_VARIABLES // len(columns))
+    full_chunks = len(rows) - len(rows) % chunk_size
+    inserted = 0
+
+    if full_chunks:
+        sql = _insert_sql(table, columns, chunk_size, or_ignore)
+        for start in range(0, full_chunks, chunk_size):
+            chunk = rows[start : start + chunk_size]
+            cursor.execute(sql, list(chain.from_iterable(chunk)))
+            inserted += cursor.rowcount
+
+    if full_chunks < len(rows):
+        sql = _insert_sql(table, columns, 1, or_ignore)
+        cursor.executemany(sql, rows[full_chunks:])
+        inserted += cursor.rowcount
+    return inserted
+
+
+def insert_translations(
+    cursor: sqlite3.Cursor, lemma: str, lexical: str, translations: Iterable[str]
+) -> list[str]:
+    """Insert English words and link them to a Greek lemma.
+
+    Args:
+        cursor: Cursor to execute the inserts on
+        lemma: Greek word lemma
+        lexical: Part of speech
+        translations: English translations
+
+    Returns:
+        The linked English words, stripped and deduplicated in input order
+    """
+    words = list(dict.fromkeys(translation.strip() for translation in translations))
+
+    # Insert missing English words, then link them in input order; the ids
+    # are resolved inside SQLite rather than fetched back into Python
+    cursor.executemany(INSERT_ENGLISH_WORD_SQL, [(word, lexical) for word in words])
+    cursor.executemany(
+        LINK_TRANSLATION_SQL, [(lemma, lexical, word, lexical) for word in words]
+    )
+    return words
+
+
+@lru_cache(maxsize=INFLECTION_CACHE_SIZE)
+def _inflect(lemma: str, lexical: str) -> Lexical:
+    """Generate a word's inflected forms with Morpheus, memoized.
+
+    The returned object is shared between callers; take a copy before setting
+    per-use attributes such as translations or the selected form.
+    """
+    return Morpheus.create(lemma, lexical)
+
 
 class Database:
     """Manages vocabulary storage and retrieval for sentence generation.
@@ -29,13 +247,84 @@ class Database:
         self._db_path = db_path
 
         if db_path is None:
-            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn = sqlite3.connect(
+                ":memory:", check_same_thread=False, cached_statements=CACHED_STATEMENTS
+            )
         else:
-            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn = sqlite3.connect(
+                db_path, check_same_thread=False, cached_statements=CACHED_STATEMENTS
+            )
 
         self._conn.row_factory = sqlite3.Row  # Enable column access by name
+        # Per-thread cursor reused by every statement, see _cursor
+        self._local = threading.local()
+        # Serializes writers: threads share the connection, hence its transaction
+        self._write_lock = threading.RLock()
+        # Guards the query result caches, which every reader thread fills
+        self._cache_lock = threading.Lock()
+        self._configure_connection()
         create_schema(self._conn)
         self._morphology_adapter = None
+        # Candidate SELECT statements keyed by (lexical, filtered feature names)
+        self._select_sql: dict[tuple[str, tuple[str, ...]], str] = {}
+        # Matching lemmas keyed by (lexical, filter items), see _get_candidates
+        self._candidate_cache: dict[tuple[str, tuple[Any, ...]], list[str]] = {}
+        # Translations keyed by (lexical, lemma), see _fetch_translations
+        self._translation_cache: dict[tuple[str, str], tuple[str, ...]] = {}
+        self._total_words: int | None = None
+        self._cache_generation: tuple[int, int] | None = None
+        # Set by preload_candidates; a full cache clear then reloads the lists
+        self._preloaded = False
+        self._preload_stale = False
+
+    @property
+    def _cursor(self) -> sqlite3.Cursor:
+        """Cursor reused for every statement issued from the current thread.
+
+        Saves allocating a cursor per query. Every caller consumes its results
+        before issuing the next statement. Cursors are per thread because the
+        API service shares one Database across its worker threads.
+
+        Rows come back as plain tuples: the lookups here only unpack them, so
+        the connection's sqlite3.Row factory is kept for the template queries.
+        """
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            cursor = self._local.cursor = self._conn.cursor()
+            cursor.row_factory = None
+        return cursor
+
+    def _configure_connection(self) -> None:
+        """Apply the regular journal and cache pragmas to the connection."""
+        # WAL and mmap are meaningless for in-memory databases
+        if self._db_path is not None:
+            for pragma in FILE_PRAGMAS:
+                self._conn.execute(pragma)
+        for pragma in CONNECTION_PRAGMAS:
+            self._conn.execute(pragma)
+
+    @contextmanager
+    def bulk_mode(self) -> Iterator["Database"]:
+        """Relax durability while bulk loading, e.g. when seeding from the CLI.
+
+        Disables fsync for the duration of the block and restores the regular
+        pragmas on exit. A power loss inside the block can lose the loaded
+        data, so only use it for loads that can be redone. After a successful
+        load the tables are re-analyzed so the planner picks the feature
+        indexes with up-to-date statistics.
+
+        Examples:
+            >>> with db.bulk_mode():
+            ...     db.add_words(words)
+        """
+        for pragma in BULK_PRAGMAS:
+            self._conn.execute(pragma)
+        try:
+            yield self
+            self._conn.execute("ANALYZE")
+            self._conn.commit()
+        finally:
+            self._configure_connection()
 
     # Storage methods
     # Random selection methods
@@ -60,91 +349,126 @@ class Database:
             >>> manager.get_random_word(c.NOUN, number=c.SINGULAR)
             Noun(lemma="άνθρωπος", ...)
         """
-        # Validate features
-        lexical_features = c.VALID_CASE_FEATURES.get(lexical, set())
-
-        valid_features = {}
-        extra_features = set()
-        for feature, value in features.items():
-            if feature in lexical_features:
-                valid_features[feature] = value
-            else:
-                extra_features.add(feature)
-
-        logger.warn(f"Extra features found for {lexical}: {extra_features}")
-
-        cursor = self._conn.cursor()
-        table = c.LEXICAL_TO_TABLE_MAP[lexical]
-
-        # Build WHERE conditions using direct column comparisons
-        conditions = []
-        where_params: list[str] = []
-
-        for feature_name, feature_value in valid_features.items():
-            # Use string constant directly and wrap in [] to allow us to use reserved
-            # sqlite3 keys as columns.  Case in this example
-            conditions.append(f"g.[{feature_name}] = ?")
-            where_params.append(feature_value)
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-        # Query with DISTINCT to handle multiple rows per lemma
-        query = f"""
-            SELECT
-                g.lemma,
-                (SELECT GROUP_CONCAT(e.word, '|')
-                 FROM translations t
-                 JOIN english_words e ON e.id = t.english_word_id
-                 WHERE t.greek_lemma = g.lemma AND t.greek_lexical = ?) as translations
-            FROM {table} g
-            WHERE {where_clause}
-            GROUP BY g.lemma
-            ORDER BY RANDOM()
-            LIMIT 1
-        """
-
-        # Parameters must be in the order they appear in the query:
-        # 1. Subquery parameter (lexical) comes first
-        # 2. WHERE clause parameters come after
-        params = [lexical] + where_params
-
-        logger.debug(f"Executing SQL with params: {params}")
-        start_time = time()
-        row = cursor.execute(query, params).fetchone()
-        elapsed_ms = (time() - start_time) * 1000
-
-        if not row:
-            logger.debug(f"Query returned no results ({elapsed_ms:.1f}ms)")
-            return None
+        return self.get_random_words([(lexical, features)])[0]
 
-        logger.debug(f"Query returned 1 row ({elapsed_ms:.1f}ms)")
+    @log_calls
+    def get_random_words(
+        self, requests: list[tuple[str, dict[str, Any]]]
+    ) -> list[Lexical | None]:
+        """Get one random word per (lexical, features) request.
+
+        Batch form of get_random_word used to fill a whole sentence: matching
+        lemmas come from the per-filter candidate cache, and the translations
+        of all chosen words are loaded in a single query.
+
+        Args:
+            requests: (lexical, features) pairs, features as for get_random_word
+
+        Returns:
+            Words in request order, None where no word matches the features
+        """
+        self._check_cache_generation()
+        # Bound once; these are looked up for every request in the loops below
+        split_features = self._split_features
+        get_candidates = self._get_candidates
+        choice = random.choice
+        create_word = self._create_word
+
+        chosen: list[tuple[str, str] | None] = []
+        for lexical, features in requests:
+            feature_names, values = split_features(lexical, features)
+            candidates = get_candidates(lexical, feature_names, values)
+            if not candidates:
+                logger.debug(f"No {lexical} matches {feature_names}={values}")
+                chosen.append(None)
+                continue
+            # Pick uniformly over distinct lemmas
+            chosen.append((lexical, choice(candidates)))
+
+        translations = self._fetch_translations(
+            {pair for pair in chosen if pair is not None}
+        )
+
+        words: list[Lexical | None] = []
+        for (lexical, features), pair in zip(requests, chosen):
+            if pair is None:
+                words.append(None)
+                continue
+            lex = create_word(pair[1], lexical, translations.get(pair))
+            lex.apply_features(**features)
+            words.append(lex)
+        return words
+
+    def _split_features(
+        self, lexical: str, features: dict[str, Any]
+    ) -> tuple[tuple[str, ...], tuple[Any, ...]]:
+        """Pick out the features a lexical's table can be filtered on.
+
+        Args:
+            lexical: Part of speech
+            features: Requested features, possibly including extras
 
-        lex = self._create_word_from_row(row, lexical)
+        Returns:
+            Sorted feature names and their values. Sorting makes identical
+            filters map to the same cache entries.
+        """
+        lexical_features = c.VALID_CASE_FEATURES.get(lexical, _NO_FEATURES)
+        valid_names = features.keys() & lexical_features
+        extra_features = features.keys() - valid_names
+        if extra_features:
+            logger.debug(f"Extra features found for {lexical}: {extra_features}")
+
+        feature_names = tuple(sorted(valid_names))
+        return feature_names, tuple(features[name] for name in feature_names)
+
+    # Lookup methods
+
+    @log_calls
+    def get_words_by_english(
+        self, word: str, lexical: str | None = None
+    ) -> list[Lexical]:
+        """Get every Greek word translated by an English word.
 
-        print(features)
-        print(valid_features)
-        lex.apply_features(**features)
-        return lex
+        One query finds the matching words and one more loads all of their
+        translations, whatever the number of lexicals involved.
+
+        Args:
+            word: English word to look up
+            lexical: Optional part of speech to restrict the results to
+
+        Returns:
+            Words ordered by lexical then lemma, empty if nothing matches
+
+        Examples:
+            >>> manager.get_words_by_english("person")
+            [Noun(lemma="άνθρωπος", ...)]
+        """
+        self._check_cache_generation()
+        matches: list[tuple[str, str]] = self._cursor.execute(
+            WORDS_BY_ENGLISH_SQL, (word, lexical, lexical)
+        ).fetchall()
+        translations = self._fetch_translations(set(matches))
+        return [
+            self._create_word(lemma, lexical, translations.get((lexical, lemma)))
+            for lexical, lemma in matches
+        ]
 
     # Helper methods
 
     def count_total_words(self) -> int:
-        """Return the total number of words in the lexicon."""
-        cursor = self._conn.cursor()
-        _ = cursor.execute(
-            """
-            SELECT
-                (SELECT COUNT(*) FROM greek_nouns) +
-                (SELECT COUNT(*) FROM greek_verbs) +
-                (SELECT COUNT(*) FROM greek_adjectives) +
-                (SELECT COUNT(*) FROM greek_articles) +
-                (SELECT COUNT(*) FROM greek_pronouns) +
-                (SELECT COUNT(*) FROM greek_prepositions) +
-                (SELECT COUNT(*) FROM greek_conjunctions) +
-                (SELECT COUNT(*) FROM greek_adverbs)
+        """Return the total number of words in the lexicon.
+
+        The count is cached until the database changes.
         """
-        )
-        return cursor.fetchone()[0]
+        self._check_cache_generation()
+        total = self._total_words
+        if total is None:
+            marker = self._cache_marker()
+            total = self._cursor.execute(COUNT_TOTAL_WORDS_SQL).fetchone()[0]
+            with self._cache_lock:
+                if self._may_cache(marker):
+                    self._total_words = total
+        return total
 
     def _get_word_by_lemma(self, lemma: str, lexical: str):
         """Helper to retrieve a word by its lemma and lexical.
@@ -156,34 +480,69 @@ class Database:
         Returns:
             Word object or None if not found
         """
-        cursor = self._conn.cursor()
-        table = c.LEXICAL_TO_TABLE_MAP[lexical]
+        if not self._cursor.execute(LEMMA_EXISTS_SQL[lexical], (lemma,)).fetchone():
+            return None
 
-        # Query with JOIN to get lemma and translations
-        query = f"""
-            SELECT
-                g.lemma,
-                (SELECT GROUP_CONCAT(e.word, '|')
-                 FROM translations t
-                 JOIN english_words e ON e.id = t.english_word_id
-                 WHERE t.greek_lemma = g.lemma AND t.greek_lexical = ?) as translations
-            FROM {table} g
-            WHERE g.lemma = ?
-            LIMIT 1
-        """
+        self._check_cache_generation()
+        translations = self._fetch_translations({(lexical, lemma)})
+        return self._create_word(lemma, lexical, translations.get((lexical, lemma)))
 
-        row = cursor.execute(query, (lexical, lemma)).fetchone()
-        if not row:
-            return None
+    def _fetch_translations(
+        self, words: set[tuple[str, str]]
+    ) -> dict[tuple[str, str], list[str]]:
+        """Fetch the English translations of many words at once.
 
-        return self._create_word_from_row(row, lexical)
+        Translations are cached per word, so a lemma drawn again only costs a
+        dict lookup; the rest are loaded with one join per chunk. Callers
+        must run _check_cache_generation first.
 
-    def _create_word_from_row(self, row: sqlite3.Row, lexical: str) -> Lexical:
-        """Create PartOfSpeech object with translations from query result.
+        Args:
+            words: (lexical, lemma) pairs to look up
+
+        Returns:
+            Translations per (lexical, lemma). Words without translations
+            are missing from the result.
+        """
+        cache = self._translation_cache
+        # Fresh lists, callers hand them to the words they build
+        found: dict[tuple[str, str], list[str]] = {}
+        missing = []
+        for pair in words:
+            cached = cache.get(pair)
+            if cached is None:
+                missing.append(pair)
+            elif cached:
+                found[pair] = list(cached)
+        if not missing:
+            return found
+
+        marker = self._cache_marker()
+        loaded: dict[tuple[str, str], list[str]] = defaultdict(list)
+        chunk_size = MAX_SQL_VARIABLES // 2
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start : start + chunk_size]
+            query = _in_list_sql(FETCH_TRANSLATIONS_SQL, len(chunk), "(?, ?)")
+            for lexical, lemma, word in self._cursor.execute(
+                query, list(chain.from_iterable(chunk))
+            ):
+                loaded[(lexical, lemma)].append(word)
+        with self._cache_lock:
+            if self._may_cache(marker):
+                for pair in missing:
+                    cache[pair] = tuple(loaded.get(pair, ()))
+
+        found.update(loaded)
+        return found
+
+    def _create_word(
+        self, lemma: str, lexical: str, translations: list[str] | None
+    ) -> Lexical:
+        """Create PartOfSpeech object with translations.
 
         Args:
-            row: Database row with id, lemma, and translations columns
-            lexical: Part of speech enum
+            lemma: Greek word lemma
+            lexical: Part of speech
+            translations: English translations, None if the word has none
 
         Returns:
             Complete PartOfSpeech object with forms and translations
@@ -191,20 +550,15 @@ class Database:
         Note:
             Pronouns bypass MGI - lemma from database is the final word form
         """
-        lemma = row["lemma"]
-        translations_str = row["translations"]
-
-        # Parse translations (GROUP_CONCAT returns pipe-delimited string)
-        translations = translations_str.split("|") if translations_str else None
-
         # For pronouns, bypass MGI and use lemma directly as the word
         if lexical == c.PRONOUN:
             word = Pronoun(pos=c.PRONOUN, lemma=lemma, forms=None)
-            word.translations = translations
+            word.translations = translations or None
         else:
             # For all other lexicals, create word with inflected forms using Morpheus
-            word = Morpheus.create(lemma, lexical)
-            word.translations = translations
+            # Shallow copy: the forms are shared with the cache, never mutated
+            word = copy.copy(_inflect(lemma, lexical))
+            word.translations = translations or None
         return word
 
     def _extract_noun_features(self, word: Lexical) -> list[dict[str, str | None]]:
@@ -216,19 +570,13 @@ class Database:
         Returns:
             List of feature dictionaries
         """
-        features_list = []
-        for gender, number_dict in word.forms.items():
-            for number, case_dict in number_dict.items():
-                for case, form in case_dict.items():
-                    if form:  # Only if form exists
-                        features_list.append(
-                            {
-                                c.GENDER: gender,
-                                c.NUMBER: number,
-                                c.CASE: case,
-                            }
-                        )
-        return features_list
+        return [
+            {c.GENDER: gender, c.NUMBER: number, c.CASE: case}
+            for gender, number_dict in word.forms.items()
+            for number, case_dict in number_dict.items()
+            for case, form in case_dict.items()
+            if form  # Only if form exists
+        ]
 
     def _extract_verb_features(self, word: Lexical) -> list[dict[str, str | None]]:
         """Extract feature combinations for verbs.
@@ -241,104 +589,67 @@ class Database:
         Returns:
             List of feature dictionaries
         """
-        features_list = []
         verb_group = getattr(word, "verb_group", None)
 
+        def row(
+            tense: str,
+            voice: str | None = None,
+            mood: str | None = None,
+            number: str | None = None,
+            person: str | None = None,
+            case: str | None = None,
+        ) -> dict[str, str | None]:
+            return {
+                "verb_group": verb_group,
+                c.TENSE: tense,
+                c.VOICE: voice,
+                c.MOOD: mood,
+                c.NUMBER: number,
+                c.PERSON: person,
+                c.CASE: case,
+            }
+
+        features_list = []
+        append = features_list.append
         for tense, voice_dict in word.forms.items():
             # Handle case where tense maps directly to a set (shouldn't happen, but defensive)
             if isinstance(voice_dict, set):
-                features_list.append(
-                    {
-                        "verb_group": verb_group,
-                        c.TENSE: tense,
-                        c.VOICE: None,
-                        c.MOOD: None,
-                        c.NUMBER: None,
-                        c.PERSON: None,
-                        c.CASE: None,
-                    }
-                )
+                append(row(tense))
                 continue
 
             for voice, mood_dict in voice_dict.items():
                 # Handle case where voice maps directly to a set (shouldn't happen, but defensive)
                 if isinstance(mood_dict, set):
-                    features_list.append(
-                        {
-                            "verb_group": verb_group,
-                            c.TENSE: tense,
-                            c.VOICE: voice,
-                            c.MOOD: None,
-                            c.NUMBER: None,
-                            c.PERSON: None,
-                            c.CASE: None,
-                        }
-                    )
+                    append(row(tense, voice))
                     continue
 
                 for mood, mood_value in mood_dict.items():
                     # Check if this is an infinitive (just a set of forms)
                     if isinstance(mood_value, set):
                         # Infinitive: no number/person/case
-                        features_list.append(
-                            {
-                                "verb_group": verb_group,
-                                c.TENSE: tense,
-                                c.VOICE: voice,
-                                c.MOOD: mood,
-                                c.NUMBER: None,
-                                c.PERSON: None,
-                                c.CASE: None,
-                            }
-                        )
+                        append(row(tense, voice, mood))
                     # Check if this is a participle (has gender level)
                     elif mood == "participle":
                         # Participle: {gender: {number: {case: {forms}}}}
-                        for gender, number_dict in mood_value.items():
-                            for number, case_dict in number_dict.items():
-                                for case, forms in case_dict.items():
-                                    if forms:
-                                        features_list.append(
-                                            {
-                                                "verb_group": verb_group,
-                                                c.TENSE: tense,
-                                                c.VOICE: voice,
-                                                c.MOOD: mood,
-                                                c.NUMBER: number,
-                                                c.PERSON: None,
-                                                c.CASE: case,
-                                            }
-                                        )
+                        features_list.extend(
+                            row(tense, voice, mood, number, case=case)
+                            for number_dict in mood_value.values()
+                            for number, case_dict in number_dict.items()
+                            for case, forms in case_dict.items()
+                            if forms
+                        )
                     else:
                         # Regular mood: {number: {person: {forms}}}
                         for number, person_dict in mood_value.items():
                             # Handle case where number maps directly to a set (no person level)
                             if isinstance(person_dict, set):
-                                features_list.append(
-                                    {
-                                        "verb_group": verb_group,
-                                        c.TENSE: tense,
-                                        c.VOICE: voice,
-                                        c.MOOD: mood,
-                                        c.NUMBER: number,
-                                        c.PERSON: None,
-                                        c.CASE: None,
-                                    }
-                                )
+                                append(row(tense, voice, mood, number))
                             else:
-                                for person, forms in person_dict.items():
-                                    if forms:
-                                        features_list.append(
-                                            {
-                                                "verb_group": verb_group,
-                                                c.TENSE: tense,
-                                                c.VOICE: voice,
-                                                c.MOOD: mood,
-                                                c.NUMBER: number,
-                                                c.PERSON: person,
-                                                c.CASE: None,
-                                            }
-                                        )
+                                features_list.extend(
+                                    row(tense, voice, mood, number, person)
+                                    for person, forms in person_dict.items()
+                                    if forms
+                                )
         return features_list
 
     def _extract_adjective_features(self, word: Lexical) -> list[dict[str, str | None]]:
@@ -350,19 +661,13 @@ class Database:
         Returns:
             List of feature dictionaries
         """
-        features_list = []
-        for number, gender_dict in word.forms.get(c.ADJECTIVE, {}).items():
-            for gender, case_dict in gender_dict.items():
-                for case, form in case_dict.items():
-                    if form:
-                        features_list.append(
-                            {
-                                c.GENDER: gender,
-                                c.NUMBER: number,
-                                c.CASE: case,
-                            }
-                        )
-        return features_list
+        return [
+            {c.GENDER: gender, c.NUMBER: number, c.CASE: case}
+            for number, gender_dict in word.forms.get(c.ADJECTIVE, {}).items()
+            for gender, case_dict in gender_dict.items()
+            for case, form in case_dict.items()
+            if form
+        ]
 
     def _extract_pronoun_features(self, word: Lexical) -> list[dict[str, str | None]]:
         """Extract feature combinations for pronouns.
@@ -440,16 +745,8 @@ class Database:
         if not translations:
             raise ValueError("At least one translation required")
 
-        table = c.LEXICAL_TO_TABLE_MAP[lexical]
-        cursor = self._conn.cursor()
-        existing = cursor.execute(
-            f"SELECT id FROM {table} WHERE lemma = ?", (lemma,)
-        ).fetchone()
-        if existing:
-            raise ValueError(f"Word '{lemma}' already exists as {lexical}")
-
         try:
-            word = Morpheus.create(lemma, lexical)
+            word = copy.copy(_inflect(lemma, lexical))
         except Exception as e:
             raise ValueError(f"Failed to generate forms for '{lemma}': {e}")
 
@@ -458,100 +755,305 @@ class Database:
 
         return word
 
-    def _prepare_database_values(
-        self, lemma: str, lexical: str, word: Lexical, features: dict[str, str | None]
-    ) -> dict[str, str | int | None]:
-        """Prepare values for one database row (one feature combination).
+    def _check_new_lemma(self, lemma: str, lexical: str) -> None:
+        """Raise ValueError if the lexical has no table or already has the lemma."""
+        query = LEMMA_EXISTS_SQL.get(lexical)
+        if query is None:
+            raise ValueError(f"Unsupported lexical '{lexical}'")
+        existing = self._cursor.execute(query, (lemma,)).fetchone()
+        if existing:
+            raise ValueError(f"Word '{lemma}' already exists as {lexical}")
+
+    def _prepare_rows(
+        self, lemma: str, lexical: str, features_list: list[dict[str, str | None]]
+    ) -> list[list[Any]]:
+        """Build the INSERT parameters for every feature combination of a word.
+
+        Rows start from a copy of the lexical's template row, so each one only
+        pays for its own feature assignments.
 
         Args:
             lemma: Greek word lemma
             lexical: Part of speech
-            word: Morpheus-generated word object
-            features: Feature dictionary for this specific row
+            features_list: Feature dictionaries, one per row
 
         Returns:
-            Dictionary mapping field names to values for INSERT
+            Parameter lists ordered like LEXICAL_CONFIG[lexical]["fields"]
+        """
+        template, positions = _row_layout(lexical)
+        template = list(template)
+        template[positions["lemma"]] = lemma
+
+        rows = []
+        for features in features_list:
+            row = template.copy()
+            for key, value in features.items():
+                index = positions.get(key)
+                if index is not None:
+                    row[index] = value
+            rows.append(row)
+        return rows
+
+    def _insert_rows(
+        self, cursor: sqlite3.Cursor, lexical: str, rows: list[list[Any]]
+    ) -> None:
+        """Insert Greek word rows (one per feature combination) for a lexical.
+
+        Args:
+            cursor: Cursor to execute the insert on
+            lexical: Part of speech
+            rows: Parameter lists ordered like LEXICAL_CONFIG[lexical]["fields"]
+        """
+        fields = tuple(c.LEXICAL_CONFIG[lexical]["fields"])
+        insert_rows(cursor, c.LEXICAL_TO_TABLE_MAP[lexical], fields, rows)
+
+    def _get_candidates(
+        self, lexical: str, feature_names: tuple[str, ...], values: tuple[Any, ...]
+    ) -> list[str]:
+        """Return the distinct lemmas matching a set of feature filters.
+
+        Results are cached per filter so repeated template tokens only pay for
+        a random.choice instead of an ORDER BY RANDOM() over every match.
+        Callers run _check_cache_generation first so the cache is dropped
+        whenever the database changed.
+
+        Args:
+            lexical: Part of speech
+            feature_names: Sorted feature columns to filter on
+            values: Values for feature_names, in the same order
         """
-        config = c.LEXICAL_CONFIG[lexical]
-        fields = config["fields"]
+        key = (lexical, feature_names + values)
+        candidates = self._candidate_cache.get(key)
+        if candidates is None:
+            query = self._get_select_sql(lexical, feature_names)
+            marker = self._cache_marker()
+            start_time = time()
+            candidates = [row[0] for row in self._cursor.execute(query, values)]
+            elapsed_ms = (time() - start_time) * 1000
+            logger.debug(
+                f"Loaded {len(candidates)} {lexical} candidates ({elapsed_ms:.1f}ms)"
+            )
+            with self._cache_lock:
+                if self._may_cache(marker):
+                    self._candidate_cache[key] = candidates
+        return candidates
+
+    def preload_candidates(self) -> int:
+        """Fill the candidate cache for every feature combination in the lexicon.
+
+        Loads each greek_* table once, grouped by all of its filterable
+        features, so later get_random_word(s) calls with complete feature
+        sets never query for candidates. Requests with partial features still
+        fall back to a live query. Meant for long-lived processes such as the
+        API service.
+
+        The preload survives writes: when another connection commits, the
+        next lookup clears the cache and loads it again. Words added through
+        this instance only drop the lists of their own lexical, which then
+        refill per filter as they are requested.
 
-        values: dict[str, str | int | None] = {
-            "lemma": lemma,
-            "validation_status": "VALID",
-        }
+        Returns:
+            Number of feature combinations cached, 0 if a write transaction
+            was open and the lists will be loaded on the next lookup instead
+        """
+        self._check_cache_generation()
+        self._preloaded = True
+        loaded = self._load_candidates()
+        self._preload_stale = loaded is None
+        return loaded or 0
 
-        # Add all features from the dictionary
-        for key, value in features.items():
-            if key in fields:
-                values[key] = value
+    def _load_candidates(self) -> int | None:
+        """Load the candidates of every feature combination, see preload_candidates.
 
-        # Ensure all fields have a value (None for missing ones)
-        for field in fields:
-            if field not in values:
-                values[field] = None
+        Returns:
+            Number of feature combinations cached, None if the results could
+            not be cached because a write transaction was open
+        """
+        marker = self._cache_marker()
+        loaded: dict[tuple[str, tuple[Any, ...]], list[str]] = {}
+        for lexical, table in c.LEXICAL_TO_TABLE_MAP.items():
+            feature_names = tuple(sorted(c.VALID_CASE_FEATURES.get(lexical, ())))
+            columns = ", ".join([f"[{name}]" for name in feature_names] + ["lemma"])
+            grouped: dict[tuple[Any, ...], list[str]] = defaultdict(list)
+            for *values, lemma in self._cursor.execute(
+                f"SELECT DISTINCT {columns} FROM {table}"
+            ):
+                grouped[tuple(values)].append(lemma)
+            for values, lemmas in grouped.items():
+                loaded[(lexical, feature_names + values)] = lemmas
+        with self._cache_lock:
+            if not self._may_cache(marker):
+                return None
+            self._candidate_cache.update(loaded)
+
+        logger.info(f"Preloaded {len(loaded)} candidate lists")
+        return len(loaded)
+
+    def _check_cache_generation(self) -> None:
+        """Clear query result caches if the database changed since last use.
+
+        Changes are detected through total_changes (writes on this connection,
+        including seeds using it directly) and PRAGMA data_version (commits
+        from other connections). Preloaded candidates are loaded again after
+        a clear, once no write transaction is open.
+        """
+        generation = (self._conn.total_changes, self._data_version())
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                self._candidate_cache.clear()
+                self._translation_cache.clear()
+                self._total_words = None
+                self._cache_generation = generation
+                self._preload_stale = self._preloaded
+        if self._preload_stale and not self._conn.in_transaction:
+            self._preload_stale = self._load_candidates() is None
+
+    def _data_version(self) -> int:
+        """Return PRAGMA data_version, which changes when another connection commits.
+
+        In-memory databases are private to their connection, so they skip the
+        statement.
+        """
+        if self._db_path is None:
+            return 0
+        return self._cursor.execute("PRAGMA data_version").fetchone()[0]
 
-        return values
+    def _cache_marker(self) -> int | None:
+        """Mark the start of a query whose results may be cached.
+
+        Threads share the connection, so a query sees the rows of a write
+        transaction another thread has open and may still roll back.
+
+        Returns:
+            None while a transaction is open, else the connection's
+            total_changes to hand to _may_cache once the query is done
+        """
+        if self._conn.in_transaction:
+            return None
+        return self._conn.total_changes
+
+    def _may_cache(self, marker: int | None) -> bool:
+        """Check that results read since _cache_marker only saw committed rows.
+
+        Any write on the connection since the marker may have been visible to
+        the query. Call with _cache_lock held.
+        """
+        return (
+            marker is not None
+            and not self._conn.in_transaction
+            and self._conn.total_changes == marker
+        )
+
+    def _forget_lexicals(
+        self, lexicals: set[str], generation: tuple[int, int] | None
+    ) -> None:
+        """Drop cached lookups for lexicals this instance just wrote to.
+
+        Keeps the candidates of every other lexical instead of letting the
+        next generation check clear the whole cache. Falls back to that full
+        clear if anything else changed the database since ``generation``.
+
+        Args:
+            lexicals: Lexicals whose tables were written to
+            generation: Cache generation synced right before the write
+        """
+        data_version = self._data_version()
+        with self._cache_lock:
+            if generation is None or generation != self._cache_generation:
+                return
+            if data_version != generation[1]:
+                # Another connection committed meanwhile
+                return
+
+            for cache in (self._candidate_cache, self._translation_cache):
+                for key in [key for key in list(cache) if key[0] in lexicals]:
+                    del cache[key]
+            self._total_words = None
+            self._cache_generation = (self._conn.total_changes, data_version)
+
+    def _get_select_sql(self, lexical: str, feature_names: tuple[str, ...]) -> str:
+        """Return the candidate SELECT statement for a set of filters.
+
+        The string is built once per (lexical, feature_names) so every lookup
+        with the same filter shape reuses the same SQL text and hits sqlite3's
+        statement cache.
+
+        Args:
+            lexical: Part of speech
+            feature_names: Sorted feature columns filtered with ``= ?``
+        """
+        key = (lexical, feature_names)
+        sql = self._select_sql.get(key)
+        if sql is None:
+            table = c.LEXICAL_TO_TABLE_MAP[lexical]
+            # Wrap columns in [] to allow reserved sqlite3 keys such as case
+            where_clause = (
+                " AND ".join([f"g.[{name}] = ?" for name in feature_names]) or "1=1"
+            )
+            sql = f"SELECT DISTINCT g.lemma FROM {table} g WHERE {where_clause}"
+            self._select_sql[key] = sql
+        return sql
 
     def _execute_add_word_transaction(
         self,
         lexical: str,
         lemma: str,
-        values_list: list[dict[str, Any]],
+        rows: list[list[Any]],
         translations: list[str],
-    ) -> None:
-        """Execute database transaction to add word with multiple feature rows.
+    ) -> list[str]:
+        """Check a word is new and insert its rows and translations atomically.
+
+        Takes the database write lock with BEGIN IMMEDIATE before the
+        existence check, so no other connection can add the lemma in between.
+        A transaction the caller already has open is used as is and left for
+        the caller to commit or roll back.
 
         Args:
             lexical: Part of speech
             lemma: Greek word lemma
-            values_list: List of value dictionaries (one per feature combination)
+            rows: INSERT parameters, one list per feature combination
             translations: English translations
+
+        Returns:
+            The English words linked to the lemma
+
+        Raises:
+            ValueError: If the word already exists
         """
-        table = c.LEXICAL_TO_TABLE_MAP[lexical]
-        config = c.LEXICAL_CONFIG[lexical]
-        fields = config["fields"]
-        cursor = self._conn.cursor()
+        cursor = self._cursor
+        # Held across the existence check so concurrent adds of one lemma on
+        # the shared connection cannot both pass it
+        with self._write_lock:
+            self._check_cache_generation()
+            generation = self._cache_generation
 
-        try:
-            # Step 1: Insert all Greek word rows (one per feature combination)
-            columns = ", ".join(f'"{field}"' for field in fields)
-            placeholders = ", ".join(["?"] * len(fields))
-            sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-
-            for values in values_list:
-                cursor.execute(sql, [values.get(field) for field in fields])
-
-            # Step 2: Insert/retrieve English words
-            english_word_ids = []
-            for translation in translations:
-                translation = translation.strip()
-                cursor.execute(
-                    "INSERT OR IGNORE INTO english_words (word, lexical) VALUES (?, ?)",
-                    (translation, lexical),
-                )
-                eng_id_row = cursor.execute(
-                    "SELECT id FROM english_words WHERE word = ? AND lexical = ?",
-                    (translation, lexical),
-                ).fetchone()
-                if eng_id_row:
-                    english_word_ids.append(eng_id_row[0])
-
-            # Step 3: Create translation links (one per lemma, not per row)
-            for eng_id in english_word_ids:
-                cursor.execute(
-                    "INSERT OR IGNORE INTO translations (english_word_id, greek_lemma, greek_lexical) VALUES (?, ?, ?)",
-                    (eng_id, lemma, lexical),
-                )
+            opened = not self._conn.in_transaction
+            if opened:
+                cursor.execute("BEGIN IMMEDIATE")
+            try:
+                self._check_new_lemma(lemma, lexical)
 
-            self._conn.commit()
+                # Step 1: Insert all Greek word rows (one per feature combination)
+                self._insert_rows(cursor, lexical, rows)
 
-        except Exception:
-            self._conn.rollback()
-            raise
+                # Step 2: Insert English words and create translation links
+                words = insert_translations(cursor, lemma, lexical, translations)
 
-    @log_calls
-    def add_word(self, lemma: str, translations: list[str], lexical: str) -> Lexical:
-        """Add a word to the lexicon with automatic feature extraction.
+                if opened:
+                    self._conn.commit()
+
+            except Exception:
+                if opened:
+                    self._conn.rollback()
+                raise
+
+            self._forget_lexicals({lexical}, generation)
+        return words
+
+    def _prepare_word(
+        self, lemma: str, translations: list[str], lexical: str
+    ) -> tuple[Lexical, list[list[Any]]]:
+        """Validate a word and build the INSERT rows for each of its forms.
 
         Args:
             lemma: Greek word in its base form
@@ -559,10 +1061,11 @@ class Database:
             lexical: Part of speech string constant (c.NOUN, c.VERB, etc.)
 
         Returns:
-            Complete PartOfSpeech object with forms and translations
+            Tuple of the Morpheus-generated word and one parameter list per
+            feature combination
 
         Raises:
-            ValueError: If translations empty, lemma empty, word exists, or Morpheus fails
+            ValueError: If translations empty, lemma empty, or Morpheus fails
         """
         # Validate inputs
         word = self._validate_and_prepare_lemma(lemma, lexical, translations)
@@ -574,20 +1077,127 @@ class Database:
             raise ValueError(f"No valid feature combinations found for '{lemma}'")
 
         # Prepare database values for each feature combination
-        values_list = [
-            self._prepare_database_values(lemma, lexical, word, features)
-            for features in features_list
-        ]
+        return word, self._prepare_rows(lemma, lexical, features_list)
 
-        # Execute transaction to insert all rows
-        self._execute_add_word_transaction(lexical, lemma, values_list, translations)
+    @log_calls
+    def add_word(self, lemma: str, translations: list[str], lexical: str) -> Lexical:
+        """Add a word to the lexicon with automatic feature extraction.
 
-        # Retrieve and return the word
-        new_word = self._get_word_by_lemma(lemma, lexical)
-        if not new_word:
-            raise RuntimeError(f"Failed to retrieve newly added word '{lemma}'")
+        Args:
+            lemma: Greek word in its base form
+            translations: List of English translations (at least one required)
+            lexical: Part of speech string constant (c.NOUN, c.VERB, etc.)
+
+        Returns:
+            Complete PartOfSpeech object with forms and translations
+
+        Raises:
+            ValueError: If translations empty, lemma empty, word exists, or Morpheus fails
+        """
+        # Reject a stored lemma before paying for Morpheus; the transaction
+        # below checks again, since another writer may add it meanwhile
+        with self._write_lock:
+            self._check_new_lemma(lemma, lexical)
+
+        # Inflect outside the transaction: Morpheus is the slowest step and
+        # must not block other writers
+        _, rows = self._prepare_word(lemma, translations, lexical)
+
+        # Execute transaction to check the lemma is new and insert all rows
+        words = self._execute_add_word_transaction(lexical, lemma, rows, translations)
+
+        # Everything needed is at hand, no need to read the word back
+        new_word = self._create_word(lemma, lexical, words)
 
         logger.info(
             f"Added word '{lemma}' ({lexical}) with {len(translations)} translations"
         )
         return new_word
+
+    @log_calls
+    def add_words(
+        self,
+        words: Iterable[tuple[str, list[str], str]],
+        batch_size: int = BULK_BATCH_SIZE,
+        skipped: list[tuple[str, str, str]] | None = None,
+    ) -> int:
+        """Add many words to the lexicon in a single transaction.
+
+        Bulk counterpart of add_word for seeding. Greek word rows are buffered
+        per lexical and flushed with executemany once a buffer reaches
+        batch_size, instead of committing once per word. A transaction the
+        caller already has open is used as is and left for the caller to end.
+
+        Args:
+            words: Iterable of (lemma, translations, lexical) tuples
+            batch_size: Number of buffered rows per lexical before flushing
+            skipped: If given, invalid or already existing words are appended
+                to it as (lemma, lexical, reason) and the rest of the batch is
+                still added, so a partly seeded database can be seeded again
+
+        Returns:
+            Number of words added
+
+        Raises:
+            ValueError: If any word is invalid or already exists and skipped is
+                None. Nothing from the batch is committed in that case.
+        """
+        buckets: dict[str, list[list[Any]]] = defaultdict(list)
+        pending: set[tuple[str, str]] = set()
+        cursor = self._cursor
+        count = 0
+        # Bound once; these are looked up for every word in the loop below
+        prepare_word = self._prepare_word
+
+        with self._write_lock:
+            self._check_cache_generation()
+            generation = self._cache_generation
+
+            # Take the write lock up front: a deferred transaction that starts with
+            # reads can fail with SQLITE_BUSY when upgrading to a writer in WAL mode
+            opened = not self._conn.in_transaction
+            if opened:
+                cursor.execute("BEGIN IMMEDIATE")
+            try:
+                for lemma, translations, lexical in words:
+                    try:
+                        # Buffered rows are invisible to the existence check
+                        if (lexical, lemma) in pending:
+                            raise ValueError(
+                                f"Word '{lemma}' already exists as {lexical}"
+                            )
+                        self._check_new_lemma(lemma, lexical)
+                        _, rows = prepare_word(lemma, translations, lexical)
+                    except ValueError as e:
+                        if skipped is None:
+                            raise
+                        # Nothing of this word was written yet
+                        logger.warning(f"Skipped '{lemma}' ({lexical}): {e}")
+                        skipped.append((lemma, lexical, str(e)))
+                        continue
+                    pending.add((lexical, lemma))
+
+                    bucket = buckets[lexical]
+                    bucket.extend(rows)
+                    if len(bucket) >= batch_size:
+                        self._insert_rows(cursor, lexical, bucket)
+                        bucket.clear()
+
+                    insert_translations(cursor, lemma, lexical, translations)
+                    count += 1
+
+                for lexical, bucket in buckets.items():
+                    if bucket:
+                        self._insert_rows(cursor, lexical, bucket)
+
+                if opened:
+                    self._conn.commit()
+
+            except Exception:
+                if opened:
+                    self._conn.rollback()
+                raise
+
+            self._forget_lexicals(set(buckets), generation)
+        logger.info(f"Added {count} words in bulk")
+        return count
@@ -2,6 +2,151 @@
 
 import sqlite3
 
+# Composite indexes over the feature columns get_random_word filters on. lemma
+# comes last so the DISTINCT lemma candidate query is answered from the index.
+# Columns that templates may leave unset go last among the features, so the
+# ones that are set still form an index prefix (pronoun gender is usually only
+# given in the third person).
+FEATURE_INDEXES = {
+    "greek_nouns": ("gender", "number", "[case]", "lemma"),
+    "greek_adjectives": ("gender", "number", "[case]", "lemma"),
+    "greek_articles": ("gender", "number", "[case]", "lemma"),
+    "greek_pronouns": ("type", "person", "number", "[case]", "gender", "lemma"),
+    "greek_verbs": ("tense", "voice", "mood", "number", "person", "lemma"),
+}
+
+# CREATE TABLE statements keyed by table name. Kept apart so a table whose
+# stored definition is outdated can be rebuilt from its current one.
+_TABLE_DDL = {
+    "english_words": """
+    CREATE TABLE IF NOT EXISTS english_words (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        word     TEXT NOT NULL,
+        lexical TEXT NOT NULL
+    )
+""",
+    "greek_nouns": """
+    CREATE TABLE IF NOT EXISTS greek_nouns (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lemma TEXT NOT NULL,
+        gender TEXT NOT NULL,
+        number TEXT NOT NULL,
+        [case] TEXT NOT NULL,
+        validation_status INTEGER NOT NULL DEFAULT 0
+            CHECK (validation_status IN (0, 1)),
+        UNIQUE(lemma, gender, number, [case])
+    )
+""",
+    "greek_verbs": """
+    CREATE TABLE IF NOT EXISTS greek_verbs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lemma TEXT NOT NULL,
+        verb_group TEXT,
+        tense TEXT,
+        voice TEXT,
+        mood TEXT,
+        number TEXT,
+        person TEXT,
+        [case] TEXT,
+        validation_status INTEGER NOT NULL DEFAULT 0
+            CHECK (validation_status IN (0, 1)),
+        UNIQUE(lemma, verb_group, tense, voice, mood, number, person, [case])
+    )
+""",
+    "greek_adjectives": """
+    CREATE TABLE IF NOT EXISTS greek_adjectives (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lemma TEXT NOT NULL,
+        gender TEXT,
+        number TEXT,
+        [case] TEXT,
+        validation_status INTEGER NOT NULL DEFAULT 0
+            CHECK (validation_status IN (0, 1)),
+        UNIQUE(lemma, gender, number, [case])
+    )
+""",
+    "greek_articles": """
+    CREATE TABLE IF NOT EXISTS greek_articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lemma TEXT NOT NULL,
+        type TEXT NOT NULL,
+        gender TEXT,
+        number TEXT,
+        [case] TEXT,
+        validation_status INTEGER NOT NULL DEFAULT 0
+            CHECK (validation_status IN (0, 1)),
+        UNIQUE(lemma, gender, number, [case])
+    )
+""",
+    "greek_pronouns": """
+    CREATE TABLE IF NOT EXISTS greek_pronouns (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lemma TEXT NOT NULL,
+        type TEXT NOT NULL,
+        person TEXT,
+        gender TEXT,
+        number TEXT,
+        [case] TEXT,
+        validation_status INTEGER NOT NULL DEFAULT 0
+            CHECK (validation_status IN (0, 1)),
+        UNIQUE(lemma, type, person, gender, number, [case])
+    )
+""",
+    "greek_prepositions": """
+    CREATE TABLE IF NOT EXISTS greek_prepositions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lemma TEXT NOT NULL UNIQUE,
+        validation_status INTEGER NOT NULL DEFAULT 0
+            CHECK (validation_status IN (0, 1))
+    )
+""",
+    "greek_conjunctions": """
+    CREATE TABLE IF NOT EXISTS greek_conjunctions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lemma TEXT NOT NULL UNIQUE,
+        validation_status INTEGER NOT NULL DEFAULT 0
+            CHECK (validation_status IN (0, 1))
+    )
+""",
+    "greek_adverbs": """
+    CREATE TABLE IF NOT EXISTS greek_adverbs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        lemma TEXT NOT NULL UNIQUE,
+        validation_status INTEGER NOT NULL DEFAULT 0
+            CHECK (validation_status IN (0, 1))
+    )
+""",
+    "translations": """
+    CREATE TABLE IF NOT EXISTS translations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        english_word_id INTEGER NOT NULL,
+        greek_lemma TEXT NOT NULL,
+        greek_lexical TEXT NOT NULL,
+        FOREIGN KEY (english_word_id) REFERENCES english_words(id),
+        UNIQUE(english_word_id, greek_lemma, greek_lexical)
+    )
+""",
+    "templates": """
+    CREATE TABLE IF NOT EXISTS templates (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        template TEXT NOT NULL UNIQUE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+""",
+}
+
+# Tables and plain indexes, run as one script. Indexes that may need migrating
+# are created by create_schema afterwards.
+_SCHEMA_DDL = (
+    ";\n".join(_TABLE_DDL.values())
+    + """;
+-- Translations are looked up by Greek word, which the UNIQUE constraint
+-- (leading with english_word_id) cannot serve
+CREATE INDEX IF NOT EXISTS ix_translations_greek
+ON translations (greek_lemma, greek_lexical, english_word_id);
+"""
+)
+
 
 def create_schema(conn: sqlite3.Connection) -> None:
     """Create all tables for lexical storage.
@@ -11,155 +156,127 @@ def create_schema(conn: sqlite3.Connection) -> None:
     """
     cursor = conn.cursor()
 
-    # English words table
-    _ = cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS english_words (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            word     TEXT NOT NULL,
-            lexical TEXT NOT NULL
-        )
-    """
-    )
+    # executescript commits any open transaction before running
+    _ = cursor.executescript(_SCHEMA_DDL)
 
-    # Greek nouns table
-    _ = cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS greek_nouns (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lemma TEXT NOT NULL,
-            gender TEXT NOT NULL,
-            number TEXT NOT NULL,
-            [case] TEXT NOT NULL,
-            validation_status TEXT NOT NULL,
-            UNIQUE(lemma, gender, number, [case])
-        )
-    """
-    )
+    # Tables created before validation_status became an integer code still
+    # have the old TEXT NOT NULL column without a default
+    for table in _TABLE_DDL:
+        if _column_type(cursor, table, "validation_status") == "TEXT":
+            _migrate_validation_status(cursor, table)
 
-    # Greek verbs table
-    _ = cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS greek_verbs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lemma TEXT NOT NULL,
-            verb_group TEXT,
-            tense TEXT,
-            voice TEXT,
-            mood TEXT,
-            number TEXT,
-            person TEXT,
-            [case] TEXT,
-            validation_status TEXT NOT NULL,
-            UNIQUE(lemma, verb_group, tense, voice, mood, number, person, [case])
+    for table, columns in FEATURE_INDEXES.items():
+        name = f"ix_{table}_features"
+        # Rebuild indexes created with an older column order
+        existing = _index_columns(cursor, name)
+        if existing and existing != [column.strip("[]") for column in columns]:
+            _ = cursor.execute(f"DROP INDEX {name}")
+        _ = cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
         )
-    """
-    )
 
-    # Greek adjectives table
-    _ = cursor.execute(
+    # One row per English word and lexical, so INSERT OR IGNORE deduplicates
+    # and the id lookup after it is an index probe
+    if not _index_exists(cursor, "ux_english_words_word_lexical"):
+        _dedupe_english_words(cursor)
+        _ = cursor.execute(
+            """
+            CREATE UNIQUE INDEX ux_english_words_word_lexical
+            ON english_words (word, lexical)
         """
-        CREATE TABLE IF NOT EXISTS greek_adjectives (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lemma TEXT NOT NULL,
-            gender TEXT,
-            number TEXT,
-            [case] TEXT,
-            validation_status TEXT NOT NULL,
-            UNIQUE(lemma, gender, number, [case])
         )
-    """
-    )
 
-    # Greek articles table
-    _ = cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS greek_articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lemma TEXT NOT NULL,
-            type TEXT NOT NULL,
-            gender TEXT,
-            number TEXT,
-            [case] TEXT,
-            validation_status TEXT NOT NULL,
-            UNIQUE(lemma, gender, number, [case])
-        )
-    """
-    )
+    conn.commit()
 
-    # Greek pronouns table
-    _ = cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS greek_pronouns (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lemma TEXT NOT NULL,
-            type TEXT NOT NULL,
-            person TEXT,
-            gender TEXT,
-            number TEXT,
-            [case] TEXT,
-            validation_status TEXT NOT NULL,
-            UNIQUE(lemma, type, person, gender, number, [case])
-        )
-    """
-    )
 
-    # Greek prepositions table
-    _ = cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS greek_prepositions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lemma TEXT NOT NULL UNIQUE,
-            validation_status TEXT NOT NULL
-        )
-    """
-    )
+def _index_exists(cursor: sqlite3.Cursor, name: str) -> bool:
+    """Check whether an index with the given name exists."""
+    row = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+    ).fetchone()
+    return row is not None
 
-    # Greek conjunctions table
-    _ = cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS greek_conjunctions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lemma TEXT NOT NULL UNIQUE,
-            validation_status TEXT NOT NULL
-        )
+
+def _index_columns(cursor: sqlite3.Cursor, name: str) -> list[str]:
+    """Return an index's column names in order, empty if it does not exist."""
+    return [row[2] for row in cursor.execute(f"PRAGMA index_info({name})")]
+
+
+def _column_type(cursor: sqlite3.Cursor, table: str, column: str) -> str | None:
+    """Return a column's declared type, None if the table lacks the column."""
+    for row in cursor.execute(f"PRAGMA table_info({table})"):
+        if row[1] == column:
+            return row[2].upper()
+    return None
+
+
+def _migrate_validation_status(cursor: sqlite3.Cursor, table: str) -> None:
+    """Rebuild a table whose validation_status is still stored as text.
+
+    The table is recreated from its current definition and the rows are
+    copied over with their ids. 'VALID' and 'validated' (and the '0' that
+    add_word stored in such tables) map to VALIDATION_VALID, anything else
+    to VALIDATION_INVALID. Indexes on the old table are dropped with it and
+    recreated by create_schema.
+
+    Args:
+        cursor: Cursor on the database being migrated
+        table: Table to rebuild
     """
+    columns = ", ".join(
+        f"[{row[1]}]"
+        for row in cursor.execute(f"PRAGMA table_info({table})")
+        if row[1] != "validation_status"
     )
-
-    # Greek adverbs table
-    _ = cursor.execute(
+    old_table = f"{table}_text_status"
+    try:
+        _ = cursor.executescript(
+            f"""
+            BEGIN;
+            ALTER TABLE {table} RENAME TO {old_table};
+            {_TABLE_DDL[table]};
+            INSERT INTO {table} ({columns}, validation_status)
+            SELECT {columns},
+                CASE WHEN validation_status IN ('VALID', 'validated', '0')
+                    THEN 0 ELSE 1 END
+            FROM {old_table};
+            DROP TABLE {old_table};
+            COMMIT;
         """
-        CREATE TABLE IF NOT EXISTS greek_adverbs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            lemma TEXT NOT NULL UNIQUE,
-            validation_status TEXT NOT NULL
         )
-    """
-    )
+    except sqlite3.Error:
+        cursor.connection.rollback()
+        raise
+
 
-    # Translation junction table
+def _dedupe_english_words(cursor: sqlite3.Cursor) -> None:
+    """Merge duplicate english_words rows created before the unique index.
+
+    Translations pointing at a duplicate are moved to the lowest id for the
+    same (word, lexical); links that already exist there are dropped.
+
+    Args:
+        cursor: Cursor on the database being migrated
+    """
     _ = cursor.execute(
         """
-        CREATE TABLE IF NOT EXISTS translations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            english_word_id INTEGER NOT NULL,
-            greek_lemma TEXT NOT NULL,
-            greek_lexical TEXT NOT NULL,
-            FOREIGN KEY (english_word_id) REFERENCES english_words(id),
-            UNIQUE(english_word_id, greek_lemma, greek_lexical)
+        UPDATE OR IGNORE translations
+        SET english_word_id = (
+            SELECT MIN(keep.id)
+            FROM english_words dup
+            JOIN english_words keep
+              ON keep.word = dup.word AND keep.lexical = dup.lexical
+            WHERE dup.id = translations.english_word_id
         )
+        WHERE english_word_id IN (SELECT id FROM english_words)
     """
     )
-
-    # Templates table
+    keepers = "SELECT MIN(id) FROM english_words GROUP BY word, lexical"
     _ = cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS templates (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            template TEXT NOT NULL UNIQUE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
+        f"""
+        DELETE FROM translations
+        WHERE english_word_id IN (SELECT id FROM english_words)
+          AND english_word_id NOT IN ({keepers})
     """
     )
-
-    conn.commit()
+    _ = cursor.execute(f"DELETE FROM english_words WHERE id NOT IN ({keepers})")
@@ -4,6 +4,54 @@ import sqlite3
 
 from syntaxis.lib import constants as c
 
+from ..api import insert_rows
+from .translations import seed_translations
+
+
+# Format: (lemma, type, gender, number, case, english_translation)
+_ARTICLES_WITH_TRANSLATIONS = (
+    # Definite Articles masculine
+    ("ο",    c.DEFINITE,   c.MASCULINE, c.SINGULAR, c.NOMINATIVE, "the"),
+    ("ο",    c.DEFINITE,   c.MASCULINE, c.SINGULAR, c.GENITIVE,   "the"),
+    ("ο",    c.DEFINITE,   c.MASCULINE, c.SINGULAR, c.ACCUSATIVE, "the"),
+    ("ο",    c.DEFINITE,   c.MASCULINE, c.PLURAL,   c.NOMINATIVE, "the"),
+    ("ο",    c.DEFINITE,   c.MASCULINE, c.PLURAL,   c.GENITIVE,   "the"),
+    ("ο",    c.DEFINITE,   c.MASCULINE, c.PLURAL,   c.ACCUSATIVE, "the"),
+    # feminine
+    ("ο",    c.DEFINITE,   c.FEMININE,  c.SINGULAR, c.NOMINATIVE, "the"),
+    ("ο",    c.DEFINITE,   c.FEMININE,  c.SINGULAR, c.GENITIVE,   "the"),
+    ("ο",    c.DEFINITE,   c.FEMININE,  c.SINGULAR, c.ACCUSATIVE, "the"),
+    ("ο",    c.DEFINITE,   c.FEMININE,  c.PLURAL,   c.NOMINATIVE, "the"),
+    ("ο",    c.DEFINITE,   c.FEMININE,  c.PLURAL,   c.GENITIVE,   "the"),
+    ("ο",    c.DEFINITE,   c.FEMININE,  c.PLURAL,   c.ACCUSATIVE, "the"),
+    # neuter
+    ("ο",    c.DEFINITE,   c.NEUTER,    c.SINGULAR, c.NOMINATIVE, "the"),
+    ("ο",    c.DEFINITE,   c.NEUTER,    c.SINGULAR, c.ACCUSATIVE, "the"),
+    ("ο",    c.DEFINITE,   c.NEUTER,    c.SINGULAR, c.GENITIVE,   "the"),
+    ("ο",    c.DEFINITE,   c.NEUTER,    c.PLURAL,   c.NOMINATIVE, "the"),
+    ("ο",    c.DEFINITE,   c.NEUTER,    c.PLURAL,   c.ACCUSATIVE, "the"),
+    ("ο",    c.DEFINITE,   c.NEUTER,    c.PLURAL,   c.GENITIVE,   "the"),
+    # Indefinite Articles masculine
+    ("ένας", c.INDEFINITE, c.MASCULINE, c.SINGULAR, c.NOMINATIVE, "a"),
+    ("ένας", c.INDEFINITE, c.MASCULINE, c.SINGULAR, c.GENITIVE,   "a"),
+    ("ένας", c.INDEFINITE, c.MASCULINE, c.SINGULAR, c.ACCUSATIVE, "a"),
+    # feminine
+    ("ένας", c.INDEFINITE, c.FEMININE,  c.SINGULAR, c.NOMINATIVE, "a"),
+    ("ένας", c.INDEFINITE, c.FEMININE,  c.SINGULAR, c.ACCUSATIVE, "a"),
+    ("ένας", c.INDEFINITE, c.FEMININE,  c.SINGULAR, c.GENITIVE,   "a"),
+    # neuter
+    ("ένας", c.INDEFINITE, c.NEUTER,    c.SINGULAR, c.NOMINATIVE, "a"),
+    ("ένας", c.INDEFINITE, c.NEUTER,    c.SINGULAR, c.ACCUSATIVE, "a"),
+    ("ένας", c.INDEFINITE, c.NEUTER,    c.SINGULAR, c.GENITIVE,   "a"),
+)
+
+# Rows for the greek_articles table
+_ARTICLES_COLUMNS = ("lemma", "type", "gender", "number", "case")
+_ARTICLES = tuple(a[:-1] for a in _ARTICLES_WITH_TRANSLATIONS)
+
+# (lemma, english_word) pairs for the translations table
+_ARTICLE_LINKS = tuple((a[0], a[-1]) for a in _ARTICLES_WITH_TRANSLATIONS)
+
 
 def seed(conn: sqlite3.Connection) -> None:
     """Populate greek_articles table with Modern Greek articles and their translations.
@@ -13,76 +61,19 @@ def seed(conn: sqlite3.Connection) -> None:
     """
     cursor = conn.cursor()
 
-    # Format: (lemma, type, gender, number, case, validation_status, english_translation)
-    articles_with_translations = [
-        # Definite Articles masculine
-        ("ο",    c.DEFINITE,   c.MASCULINE, c.SINGULAR, c.NOMINATIVE, "validated", "the"),
-        ("ο",    c.DEFINITE,   c.MASCULINE, c.SINGULAR, c.GENITIVE,   "validated", "the"),
-        ("ο",    c.DEFINITE,   c.MASCULINE, c.SINGULAR, c.ACCUSATIVE, "validated", "the"),
-        ("ο",    c.DEFINITE,   c.MASCULINE, c.PLURAL,   c.NOMINATIVE, "validated", "the"),
-        ("ο",    c.DEFINITE,   c.MASCULINE, c.PLURAL,   c.GENITIVE,   "validated", "the"),
-        ("ο",    c.DEFINITE,   c.MASCULINE, c.PLURAL,   c.ACCUSATIVE, "validated", "the"),
-        # feminine
-        ("ο",    c.DEFINITE,   c.FEMININE,  c.SINGULAR, c.NOMINATIVE, "validated", "the"),
-        ("ο",    c.DEFINITE,   c.FEMININE,  c.SINGULAR, c.GENITIVE,   "validated", "the"),
-        ("ο",    c.DEFINITE,   c.FEMININE,  c.SINGULAR, c.ACCUSATIVE, "validated", "the"),
-        ("ο",    c.DEFINITE,   c.FEMININE,  c.PLURAL,   c.NOMINATIVE, "validated", "the"),
-        ("ο",    c.DEFINITE,   c.FEMININE,  c.PLURAL,   c.GENITIVE,   "validated", "the"),
-        ("ο",    c.DEFINITE,   c.FEMININE,  c.PLURAL,   c.ACCUSATIVE, "validated", "the"),
-        # neuter
-        ("ο",    c.DEFINITE,   c.NEUTER,    c.SINGULAR, c.NOMINATIVE, "validated", "the"),
-        ("ο",    c.DEFINITE,   c.NEUTER,    c.SINGULAR, c.ACCUSATIVE, "validated", "the"),
-        ("ο",    c.DEFINITE,   c.NEUTER,    c.SINGULAR, c.GENITIVE,   "validated", "the"),
-        ("ο",    c.DEFINITE,   c.NEUTER,    c.PLURAL,   c.NOMINATIVE, "validated", "the"),
-        ("ο",    c.DEFINITE,   c.NEUTER,    c.PLURAL,   c.ACCUSATIVE, "validated", "the"),
-        ("ο",    c.DEFINITE,   c.NEUTER,    c.PLURAL,   c.GENITIVE,   "validated", "the"),
-        # Indefinite Articles masculine
-        ("ένας", c.INDEFINITE, c.MASCULINE, c.SINGULAR, c.NOMINATIVE, "validated", "a"),
-        ("ένας", c.INDEFINITE, c.MASCULINE, c.SINGULAR, c.GENITIVE,   "validated", "a"),
-        ("ένας", c.INDEFINITE, c.MASCULINE, c.SINGULAR, c.ACCUSATIVE, "validated", "a"),
-        # feminine
-        ("ένας", c.INDEFINITE, c.FEMININE,  c.SINGULAR, c.NOMINATIVE, "validated", "a"),
-        ("ένας", c.INDEFINITE, c.FEMININE,  c.SINGULAR, c.ACCUSATIVE, "validated", "a"),
-        ("ένας", c.INDEFINITE, c.FEMININE,  c.SINGULAR, c.GENITIVE,   "validated", "a"),
-        # neuter
-        ("ένας", c.INDEFINITE, c.NEUTER,    c.SINGULAR, c.NOMINATIVE, "validated", "a"),
-        ("ένας", c.INDEFINITE, c.NEUTER,    c.SINGULAR, c.ACCUSATIVE, "validated", "a"),
-        ("ένας", c.INDEFINITE, c.NEUTER,    c.SINGULAR, c.GENITIVE,   "validated", "a"),
-    ]
-
-    # Extract article data for greek_articles table
-    articles = [a[:-1] for a in articles_with_translations]
+    # Take the write lock up front; rows and translations then land in one
+    # transaction committed at the end
+    if not conn.in_transaction:
+        cursor.execute("BEGIN IMMEDIATE")
 
     # Insert articles
-    cursor.executemany(
-        """
-        INSERT OR IGNORE INTO greek_articles
-        (lemma, type, gender, number, [case], validation_status)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        articles,
+    inserted = insert_rows(
+        cursor, "greek_articles", _ARTICLES_COLUMNS, _ARTICLES, or_ignore=True
     )
-    print(f"Seeded {cursor.rowcount} article forms into greek_articles table")
+    print(f"Seeded {inserted} article forms into greek_articles table")
 
     # Seed translations
-    for lemma, _, _, _, _, _, english_word in articles_with_translations:
-        # Insert English word
-        cursor.execute(
-            "INSERT OR IGNORE INTO english_words (word, lexical) VALUES (?, ?)",
-            (english_word, c.ARTICLE),
-        )
-        # Get English word ID
-        eng_id_row = cursor.execute(
-            "SELECT id FROM english_words WHERE word = ? AND lexical = ?",
-            (english_word, c.ARTICLE),
-        ).fetchone()
-        if eng_id_row:
-            eng_id = eng_id_row[0]
-            # Insert translation link
-            cursor.execute(
-                "INSERT OR IGNORE INTO translations (english_word_id, greek_lemma, greek_lexical) VALUES (?, ?, ?)",
-                (eng_id, lemma, c.ARTICLE),
-            )
+    seed_translations(cursor, c.ARTICLE, _ARTICLE_LINKS)
 
     conn.commit()
     print("Seeded article translations.")
@@ -0,0 +1,27 @@
+"""Translation linking shared by the seed modules."""
+
+import sqlite3
+from collections import defaultdict
+from typing import Sequence
+
+from ..api import insert_translations
+
+
+def seed_translations(
+    cursor: sqlite3.Cursor, lexical: str, links: Sequence[tuple[str, str]]
+) -> None:
+    """Insert English words and link them to seeded Greek lemmas.
+
+    Goes through the same statements as Database.add_word, one link statement
+    per lemma.
+
+    Args:
+        cursor: Cursor to execute the inserts on
+        lexical: Part of speech of the seeded lemmas
+        links: (greek_lemma, english_word) pairs
+    """
+    words_by_lemma: dict[str, list[str]] = defaultdict(list)
+    for lemma, english_word in links:
+        words_by_lemma[lemma].append(english_word)
+    for lemma, words in words_by_lemma.items():
+        insert_translations(cursor, lemma, lexical, words)
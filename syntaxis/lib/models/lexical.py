@@ -37,7 +37,7 @@ class Lexical(Generic[lexical]):
 
     def __str__(self) -> str:
         if self.word is not None:
-            return list(self.word)[0]
+            return next(iter(self.word))
         else:
             return self.lemma
 
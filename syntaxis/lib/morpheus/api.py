@@ -52,18 +52,7 @@ class Morpheus:
             >>> Morpheus.create("άνθρωπος", c.NOUN)
             Noun(lemma="άνθρωπος", forms={...})
         """
-        method_map = {
-            c.NOUN: Morpheus.noun,
-            c.VERB: Morpheus.verb,
-            c.ADJECTIVE: Morpheus.adjective,
-            c.ARTICLE: Morpheus.article,
-            c.PRONOUN: Morpheus.pronoun,
-            c.ADVERB: Morpheus.adverb,
-            c.NUMERAL: Morpheus.numeral,
-            c.PREPOSITION: Morpheus.preposition,
-            c.CONJUNCTION: Morpheus.conjunction,
-        }
-        return method_map[lexical](lemma)
+        return _CREATORS[lexical](lemma)
 
     @staticmethod
     @log_calls
@@ -125,3 +114,17 @@ class Morpheus:
     @staticmethod
     def article(lemma: str) -> Article:
         return Morpheus._get_inflected_forms(lemma, Article)
+
+
+# Lexical -> factory dispatch for Morpheus.create, built once at import
+_CREATORS = {
+    c.NOUN: Morpheus.noun,
+    c.VERB: Morpheus.verb,
+    c.ADJECTIVE: Morpheus.adjective,
+    c.ARTICLE: Morpheus.article,
+    c.PRONOUN: Morpheus.pronoun,
+    c.ADVERB: Morpheus.adverb,
+    c.NUMERAL: Morpheus.numeral,
+    c.PREPOSITION: Morpheus.preposition,
+    c.CONJUNCTION: Morpheus.conjunction,
+}
@@ -8,7 +8,7 @@ logger = logging.getLogger(__name__)
 
 
 def translate_forms(forms: dict | set) -> dict | set:
-    """Recursively translate mgi forms dictionary to syntaxis constants.
+    """Translate a nested mgi forms dictionary to syntaxis constants.
 
     Args:
         forms: Nested dictionary or set from modern_greek_inflexion
@@ -20,16 +20,22 @@ def translate_forms(forms: dict | set) -> dict | set:
         Input:  {resources.MASC: {resources.SG: {resources.NOM: {'άνθρωπος'}}}}
         Output: {'masc': {'sg': {'nom': {'άνθρωπος'}}}}
     """
-    if isinstance(forms, set):
-        return forms  # Terminal case: set of word forms
-
-    if isinstance(forms, dict):
-        translated = {}
-        for key, value in forms.items():
+    if not isinstance(forms, dict):
+        return forms  # Terminal case: set of word forms (or any other leaf)
+
+    # Walk with an explicit stack of (source, translated) dict pairs rather
+    # than recursing once per nested dict
+    translate_key = MGI_TO_SYNTAXIS.get
+    translated: dict = {}
+    stack = [(forms, translated)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
             # Translate key if it's an mgi constant, otherwise keep as-is
-            new_key = MGI_TO_SYNTAXIS.get(key, key)
-            # Recursively translate nested structures
-            translated[new_key] = translate_forms(value)
-        return translated
-
-    return forms  # Fallback for any other type
+            new_key = translate_key(key, key)
+            if isinstance(value, dict):
+                target[new_key] = nested = {}
+                stack.append((value, nested))
+            else:
+                target[new_key] = value
+    return translated
@@ -6,7 +6,7 @@ from syntaxis.lib.database import Database
 from syntaxis.lib.logging import log_calls
 from syntaxis.lib.models.lexical import Lexical
 from syntaxis.lib.templates import Template
-from syntaxis.lib.templates.ast import Feature, Group, TemplateAST
+from syntaxis.lib.templates.ast import Feature, Group, POSToken, TemplateAST
 from syntaxis.lib.templates.v1_parser import V1Parser
 from syntaxis.lib.templates.v2_parser import V2Parser
 
@@ -172,7 +172,10 @@ class Syntaxis:
         Returns:
             List of Lexical objects with inflected forms
         """
-        lexicals = []
+        # Resolve every token's features first so the whole sentence can be
+        # fetched from the database in one batch
+        token_features: list[tuple[POSToken, list[Feature]]] = []
+        requests: list[tuple[str, dict[str, str]]] = []
 
         for group in ast.groups:
             # Resolve group features (handle references and wildcards)
@@ -180,34 +183,40 @@ class Syntaxis:
                 group, ast.groups, wildcard_cache
             )
 
-            # Generate lexical for each token in group
-            for token in group.tokens:
-                # Merge features: group features + direct features (with warnings)
-                final_features = self._merge_features(
-                    resolved_group_features,
-                    token.direct_features,
-                    warn_on_override=True,
-                    context=f"Token '{token.lexical}' ",
-                )
-
-                # Convert features to kwargs for database query
-                feature_dict = {f.category: f.name for f in final_features}
-
-                # Get word from database
-                lexical = self.database.get_random_word(token.lexical, **feature_dict)
+            # Query kwargs shared by every token without direct features
+            group_feature_dict = {f.category: f.name for f in resolved_group_features}
 
-                if not lexical:
-                    # Build feature string for error message
-                    feature_str = ":".join([f.name for f in final_features])
-                    raise ValueError(
-                        f"No {token.lexical} found matching features [{feature_str}]. "
-                        f"This combination of features may not exist in the database."
+            for token in group.tokens:
+                if token.direct_features:
+                    # Merge features: group + direct features (with warnings)
+                    final_features = self._merge_features(
+                        resolved_group_features,
+                        token.direct_features,
+                        warn_on_override=True,
+                        context=f"Token '{token.lexical}' ",
                     )
+                    # Convert features to kwargs for database query
+                    feature_dict = {f.category: f.name for f in final_features}
+                else:
+                    final_features = resolved_group_features
+                    feature_dict = group_feature_dict
+
+                token_features.append((token, final_features))
+                requests.append((token.lexical, feature_dict))
 
-                logger.debug(
-                    f"Selected word '{lexical.lemma}' for token {token.lexical}"
+        lexicals = []
+        words = self.database.get_random_words(requests)
+        for (token, final_features), lexical in zip(token_features, words):
+            if not lexical:
+                # Build feature string for error message
+                feature_str = ":".join([f.name for f in final_features])
+                raise ValueError(
+                    f"No {token.lexical} found matching features [{feature_str}]. "
+                    f"This combination of features may not exist in the database."
                 )
-                lexicals.append(lexical)
+
+            logger.debug(f"Selected word '{lexical.lemma}' for token {token.lexical}")
+            lexicals.append(lexical)
 
         return lexicals
 
@@ -302,14 +311,8 @@ class Syntaxis:
             # Already resolved for this group/category
             return Feature(name=wildcard_cache[cache_key], category=feature.category)
 
-        # Determine possible values based on category
-        if feature.category == c.GENDER:
-            possible_values = [c.MASCULINE, c.FEMININE, c.NEUTER]
-        elif feature.category == c.NUMBER:
-            possible_values = [c.SINGULAR, c.PLURAL]
-        elif feature.category == c.PERSON:
-            possible_values = [c.FIRST, c.SECOND, c.THIRD]
-        else:
+        possible_values = c.WILDCARD_CHOICES.get(feature.category)
+        if possible_values is None:
             # Not a wildcard we handle, return original
             return feature
 
@@ -1,15 +1,24 @@
 """Maps feature names to their grammatical categories"""
 
+from functools import lru_cache
+
 from syntaxis.lib import constants as c
 
+# Number of distinct feature names (or prefixes) kept by get_category
+FEATURE_CACHE_SIZE = 256
+
 
 class FeatureMapper:
     """Maps feature names to grammatical categories"""
 
     @classmethod
+    @lru_cache(maxsize=FEATURE_CACHE_SIZE)
     def get_category(cls, feature_name: str) -> tuple[str, str]:
         """Get the grammatical category for a feature name
 
+        Results are memoized: the set of feature names is small and fixed, so
+        the prefix scan below only runs once per distinct name.
+
         Args:
             feature_name: The feature name (e.g., 'nom', 'masc', 'sg')
 
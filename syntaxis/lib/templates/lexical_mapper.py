@@ -1,27 +1,34 @@
 """Maps feature names to their grammatical categories"""
 
 import logging
+from functools import lru_cache
 
 from syntaxis.lib import constants as c
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct lexical names (or prefixes) kept by get_lexical
+LEXICAL_CACHE_SIZE = 256
+
 
 class LexicalMapper:
     """Maps lexical names to grammatical categories"""
 
     @classmethod
+    @lru_cache(maxsize=LEXICAL_CACHE_SIZE)
     def get_lexical(cls, lexical_name: str) -> str:
-        """Get the grammatical category for a feature name
+        """Get the full lexical name for a lexical name or a prefix of it
+
+        Results are memoized so the prefix scan runs once per distinct name.
 
         Args:
-            feature_name: The feature name (e.g., 'nom', 'masc', 'sg')
+            lexical_name: The lexical name or a unique prefix (e.g., 'noun', 'adj')
 
         Returns:
-            The category name (e.g., 'case', 'gender', 'number')
+            The full lexical name (e.g., 'noun', 'adjective')
 
         Raises:
-            ValueError: If feature name is not recognized
+            ValueError: If the lexical name is unknown or ambiguous
         """
         valid_lexicals: list[str] = []
         for lexical in c.LEXICAL_VALUES:
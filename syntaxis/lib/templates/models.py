@@ -37,14 +37,9 @@ class Token:
         return self.lexical in {c.PREPOSITION, c.CONJUNCTION, c.ADVERB}
 
     def features(self) -> dict[str, str]:
-        features = {}
-        for k, v in self.__dict__.items():
-            if k == "lexical":
-                continue
-            if v is None:
-                continue
-            features[k] = v
-        return features
+        return {
+            k: v for k, v in self.__dict__.items() if k != "lexical" and v is not None
+        }
 
 
 @dataclass
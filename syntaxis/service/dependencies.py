@@ -14,11 +14,16 @@ def get_syntaxis() -> Syntaxis:
 
     Uses lru_cache to ensure a single Syntaxis instance is reused across
     all requests, improving performance by reusing the database connection.
+    Word candidates are preloaded so requests only pick from memory. The
+    preload is reloaded after another process commits to the database, and
+    words added through this instance refill their lexical's lists on demand.
 
     Returns:
         Cached Syntaxis instance connected to ./syntaxis.db
     """
-    return Syntaxis(db_path="./syntaxis.db")
+    syntaxis = Syntaxis(db_path="./syntaxis.db")
+    syntaxis.database.preload_candidates()
+    return syntaxis
 
 
 @lru_cache()
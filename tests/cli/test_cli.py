@@ -393,12 +393,42 @@ class TestCLI:
         )
         assert result1.exit_code == 0
 
-        # Second time should fail due to duplicate lemmas
+        # Second time skips the already seeded lemmas and reports them
         result2 = runner.invoke(
             app,
             ["seed-dictionary", "--db-name", temp_db_path, "--csv-file", temp_csv_path],
         )
-        assert result2.exit_code != 0  # Should fail on duplicate
+        assert result2.exit_code == 0
+        assert "Seeded 0 words forms" in result2.stdout
+        assert "Skipped άνθρωπος (noun): Word 'άνθρωπος' already exists" in (
+            result2.stdout
+        )
+
+    def test_seed_dictionary_skips_malformed_rows(self, temp_db_path, temp_dir):
+        """Test that short rows and unknown parts of speech are reported, not fatal."""
+        csv_path = os.path.join(temp_dir, "bad_dict.csv")
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["lexical", "translations", "lemma"])
+            writer.writerow(["noun", "person", "άνθρωπος"])
+            writer.writerow(["bogus", "thing", "πράγμα"])
+            writer.writerow(["verb", "see"])
+            writer.writerow(["numeral", "one", "ένα"])
+            writer.writerow(["verb", "see,look", "βλέπω"])
+
+        result = runner.invoke(
+            app, ["seed-dictionary", "--db-name", temp_db_path, "--csv-file", csv_path]
+        )
+
+        assert result.exit_code == 0
+        assert "Seeded 2 words forms" in result.stdout
+        assert "Skipped πράγμα (bogus): unknown part of speech 'bogus'" in (
+            result.stdout
+        )
+        assert "expected 3 columns, got 2" in result.stdout
+        assert "Skipped ένα (numeral): Unsupported lexical 'numeral'" in (
+            result.stdout
+        )
 
     def test_seed_commands_create_db_if_missing(self, temp_db_path):
         """Test that seed commands work even if database doesn't exist."""
@@ -1,17 +1,20 @@
+import re
 import sqlite3
+import threading
 
 import pytest
 
 from syntaxis.lib import constants as c
+from syntaxis.lib.database import api
 from syntaxis.lib.database.api import Database
 from syntaxis.lib.models.lexical import Noun, Verb
 
 
-def test_create_word_from_row_creates_noun_with_translations():
+def test_get_word_by_lemma_creates_noun_with_translations():
     """Should create Noun object with lemma and translations."""
     manager = Database()
 
-    # Simulate a database row
+    # Write the word directly, bypassing add_word
     conn = manager._conn
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
@@ -19,7 +22,7 @@ def test_create_word_from_row_creates_noun_with_translations():
     # Insert test data (with new schema: feature columns required)
     cursor.execute(
         "INSERT INTO greek_nouns (lemma, gender, number, [case], validation_status) VALUES (?, ?, ?, ?, ?)",
-        ("άνθρωπος", "masc", "sg", "nom", "validated"),
+        ("άνθρωπος", "masc", "sg", "nom", c.VALIDATION_VALID),
     )
     cursor.execute(
         "INSERT INTO english_words (word, lexical) VALUES (?, ?)", ("person", "noun")
@@ -30,22 +33,7 @@ def test_create_word_from_row_creates_noun_with_translations():
     )
     conn.commit()
 
-    # Create mock row (using new schema: lemma-based joins)
-    cursor.execute(
-        """
-        SELECT g.lemma,
-               (SELECT GROUP_CONCAT(e.word, '|')
-                FROM translations t
-                JOIN english_words e ON e.id = t.english_word_id
-                WHERE t.greek_lemma = g.lemma AND t.greek_lexical = 'noun') as translations
-        FROM greek_nouns g
-        WHERE g.lemma = 'άνθρωπος'
-        LIMIT 1
-        """
-    )
-    row = cursor.fetchone()
-
-    result = manager._create_word_from_row(row, c.NOUN)
+    result = manager._get_word_by_lemma("άνθρωπος", c.NOUN)
 
     assert isinstance(result, Noun)
     assert result.lemma == "άνθρωπος"
@@ -53,8 +41,8 @@ def test_create_word_from_row_creates_noun_with_translations():
     assert result.forms is not None
 
 
-def test_create_word_from_row_handles_multiple_translations():
-    """Should split pipe-delimited translations."""
+def test_get_word_by_lemma_handles_multiple_translations():
+    """Should return every linked translation as a list."""
     manager = Database()
 
     conn = manager._conn
@@ -63,7 +51,7 @@ def test_create_word_from_row_handles_multiple_translations():
 
     cursor.execute(
         "INSERT INTO greek_verbs (lemma, tense, voice, mood, number, person, [case], validation_status) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-        ("τρώω", "pres", "act", "ind", "sg", "1", None, "validated"),
+        ("τρώω", "pres", "act", "ind", "sg", "1", None, c.VALIDATION_VALID),
     )
     cursor.execute(
         "INSERT INTO english_words (word, lexical) VALUES (?, ?)", ("eat", "verb")
@@ -81,28 +69,24 @@ def test_create_word_from_row_handles_multiple_translations():
     )
     conn.commit()
 
-    cursor.execute(
-        """
-        SELECT g.lemma,
-               (SELECT GROUP_CONCAT(e.word, '|')
-                FROM translations t
-                JOIN english_words e ON e.id = t.english_word_id
-                WHERE t.greek_lemma = g.lemma AND t.greek_lexical = 'verb') as translations
-        FROM greek_verbs g
-        WHERE g.lemma = 'τρώω'
-        LIMIT 1
-        """
-    )
-    row = cursor.fetchone()
-
-    result = manager._create_word_from_row(row, c.VERB)
+    result = manager._get_word_by_lemma("τρώω", c.VERB)
 
     assert isinstance(result, Verb)
     assert result.translations is not None
     assert set(result.translations) == {"eat", "consume"}
 
 
-def test_create_word_from_row_handles_no_translations():
+def test_get_word_by_lemma_keeps_translations_containing_pipes():
+    """Should not split translations on any delimiter."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person|human", "man"], c.NOUN)
+
+    result = manager._get_word_by_lemma("άνθρωπος", c.NOUN)
+
+    assert sorted(result.translations) == ["man", "person|human"]
+
+
+def test_get_word_by_lemma_handles_no_translations():
     """Should set translations to None when no translations exist."""
     manager = Database()
 
@@ -112,27 +96,99 @@ def test_create_word_from_row_handles_no_translations():
 
     cursor.execute(
         "INSERT INTO greek_nouns (lemma, gender, number, [case], validation_status) VALUES (?, ?, ?, ?, ?)",
-        ("άνθρωπος", "masc", "sg", "nom", "validated"),
+        ("άνθρωπος", "masc", "sg", "nom", c.VALIDATION_VALID),
     )
     conn.commit()
 
-    cursor.execute(
-        """
-        SELECT g.lemma,
-               (SELECT GROUP_CONCAT(e.word, '|')
-                FROM translations t
-                JOIN english_words e ON e.id = t.english_word_id
-                WHERE t.greek_lemma = g.lemma AND t.greek_lexical = 'noun') as translations
-        FROM greek_nouns g
-        WHERE g.lemma = 'άνθρωπος'
-        LIMIT 1
-        """
+    result = manager._get_word_by_lemma("άνθρωπος", c.NOUN)
+
+    assert result.translations is None
+
+
+def test_get_word_by_lemma_reuses_cached_translations_until_changed():
+    """Should serve translations from cache and reload them after a write."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+
+    first = manager._get_word_by_lemma("άνθρωπος", c.NOUN)
+    first.translations.append("mutated")
+    assert manager._translation_cache[(c.NOUN, "άνθρωπος")] == ("person",)
+
+    api.insert_translations(manager._cursor, "άνθρωπος", c.NOUN, ["human"])
+    manager._conn.commit()
+
+    result = manager._get_word_by_lemma("άνθρωπος", c.NOUN)
+    assert result.translations == ["person", "human"]
+
+
+def test_cursor_returns_plain_tuples():
+    """Should skip sqlite3.Row on the lookup cursor but keep it elsewhere."""
+    manager = Database()
+
+    assert type(manager._cursor.execute("SELECT 1").fetchone()) is tuple
+    assert isinstance(manager._conn.execute("SELECT 1").fetchone(), sqlite3.Row)
+
+
+def _query_plan(manager, query, params):
+    return " | ".join(
+        row[3] for row in manager._conn.execute(f"EXPLAIN QUERY PLAN {query}", params)
     )
-    row = cursor.fetchone()
 
-    result = manager._create_word_from_row(row, c.NOUN)
 
-    assert result.translations is None
+def _uses_index(plan, index):
+    # Matches "USING INDEX x" and "USING COVERING INDEX x" on any SQLite version
+    return re.search(rf"USING (COVERING )?INDEX {index}\b", plan) is not None
+
+
+def _scans_table(plan):
+    # Full scans of the queried tables (aliased or not); VALUES lists may scan
+    return (
+        re.search(r"SCAN (TABLE )?(t|g|e|greek_\w+|translations|english_words)\b", plan)
+        is not None
+    )
+
+
+def _unique_constraint_index(manager, table):
+    # Named by SQLite, so look it up instead of assuming sqlite_autoindex_*
+    return next(
+        row[1]
+        for row in manager._conn.execute(f"PRAGMA index_list({table})")
+        if row[3] == "u"
+    )
+
+
+def test_lookup_queries_search_indexes():
+    """Should answer the hot lookups with index searches, not table scans."""
+    manager = Database()
+
+    candidates = _query_plan(
+        manager,
+        manager._get_select_sql(c.NOUN, (c.CASE, c.GENDER, c.NUMBER)),
+        ("nom", "masc", "sg"),
+    )
+    translations = _query_plan(
+        manager, api._in_list_sql(api.FETCH_TRANSLATIONS_SQL, 2, "(?, ?)"), ("a",) * 4
+    )
+    by_english = _query_plan(manager, api.WORDS_BY_ENGLISH_SQL, ("a", None, None))
+
+    assert _uses_index(candidates, "ix_greek_nouns_features")
+    assert _uses_index(translations, "ix_translations_greek")
+    assert _uses_index(by_english, "ux_english_words_word_lexical")
+    assert _uses_index(by_english, _unique_constraint_index(manager, "translations"))
+    for plan in (candidates, translations, by_english):
+        assert not _scans_table(plan)
+
+
+def test_lemma_lookups_search_unique_indexes():
+    """Should probe each table's lemma-leading UNIQUE index by lemma."""
+    manager = Database()
+
+    for lexical, query in api.LEMMA_EXISTS_SQL.items():
+        table = c.LEXICAL_TO_TABLE_MAP[lexical]
+        plan = _query_plan(manager, query, ("a",))
+
+        assert _uses_index(plan, _unique_constraint_index(manager, table)), lexical
+        assert not _scans_table(plan), lexical
 
 
 def test_get_random_word_returns_none_when_no_match():
@@ -144,6 +200,301 @@ def test_get_random_word_returns_none_when_no_match():
     assert result is None
 
 
+def test_get_random_word_filters_on_valid_features_only():
+    """Should filter on known columns and ignore features the table lacks."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+
+    result = manager.get_random_word(
+        c.NOUN,
+        gender=c.MASCULINE,
+        case=c.NOMINATIVE,
+        number=c.SINGULAR,
+        tense=c.PRESENT,
+    )
+
+    assert result is not None
+    assert result.lemma == "άνθρωπος"
+
+
+def test_get_random_word_reuses_select_sql_for_same_filters():
+    """Should build one SELECT per filter shape regardless of keyword order."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+
+    manager.get_random_word(
+        c.NOUN, gender=c.MASCULINE, number=c.SINGULAR, case=c.NOMINATIVE
+    )
+    manager.get_random_word(
+        c.NOUN, case=c.ACCUSATIVE, number=c.PLURAL, gender=c.MASCULINE
+    )
+
+    assert list(manager._select_sql) == [(c.NOUN, (c.CASE, c.GENDER, c.NUMBER))]
+
+
+def test_get_random_word_sees_words_added_after_first_lookup():
+    """Should invalidate cached candidates when the lexicon changes."""
+    manager = Database()
+    features = dict(gender=c.MASCULINE, number=c.SINGULAR, case=c.NOMINATIVE)
+
+    assert manager.get_random_word(c.NOUN, **features) is None
+
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+    result = manager.get_random_word(c.NOUN, **features)
+
+    assert result is not None
+    assert result.lemma == "άνθρωπος"
+
+
+def test_count_total_words_tracks_added_words():
+    """Should count form rows across tables and refresh after writes."""
+    manager = Database()
+    assert manager.count_total_words() == 0
+
+    manager.add_word("και", ["and"], c.CONJUNCTION)
+    manager.add_word("πολύ", ["very"], c.ADVERB)
+
+    assert manager.count_total_words() == 2
+
+
+def test_get_words_by_english_returns_matches_across_lexicals():
+    """Should return every word with the translation, optionally filtered."""
+    manager = Database()
+    manager.add_word("καλά", ["well", "fine"], c.ADVERB)
+    manager.add_word("και", ["and"], c.CONJUNCTION)
+    manager.add_word("πηγάδι", ["well"], c.NOUN)
+
+    words = manager.get_words_by_english("well")
+
+    assert [w.lemma for w in words] == ["καλά", "πηγάδι"]
+    assert sorted(words[0].translations) == ["fine", "well"]
+    assert isinstance(words[1], Noun)
+    assert [w.lemma for w in manager.get_words_by_english("well", c.NOUN)] == [
+        "πηγάδι"
+    ]
+    assert manager.get_words_by_english("missing") == []
+
+
+def test_get_random_words_returns_words_in_request_order():
+    """Should fill each request in order, with None for unmatched ones."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person", "human"], c.NOUN)
+    manager.add_word("και", ["and"], c.CONJUNCTION)
+    noun_features = dict(gender=c.MASCULINE, number=c.SINGULAR, case=c.NOMINATIVE)
+
+    words = manager.get_random_words(
+        [
+            (c.CONJUNCTION, {}),
+            (c.NOUN, noun_features),
+            (c.NOUN, dict(noun_features, gender=c.FEMININE)),
+        ]
+    )
+
+    assert [w.lemma if w else None for w in words] == ["και", "άνθρωπος", None]
+    assert sorted(words[1].translations) == ["human", "person"]
+
+
+def test_preload_candidates_serves_lookups_from_cache():
+    """Should answer complete feature sets without querying for candidates."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+    manager.add_word("και", ["and"], c.CONJUNCTION)
+
+    assert manager.preload_candidates() > 0
+    manager._select_sql.clear()
+
+    noun = manager.get_random_word(
+        c.NOUN, gender=c.MASCULINE, number=c.SINGULAR, case=c.NOMINATIVE
+    )
+    conjunction = manager.get_random_word(c.CONJUNCTION)
+
+    assert noun.lemma == "άνθρωπος"
+    assert conjunction.lemma == "και"
+    assert manager._select_sql == {}
+
+
+def test_preload_candidates_reloads_after_commit_from_other_connection(tmp_path):
+    """Should load the preloaded candidates again once another writer commits."""
+    db_path = str(tmp_path / "lexicon.db")
+    service = Database(db_path)
+    service.add_word("πολύ", ["very"], c.ADVERB)
+    service.preload_candidates()
+
+    Database(db_path).add_word("άνθρωπος", ["person"], c.NOUN)
+    service.get_random_word(c.ADVERB)
+
+    # Keyed by the sorted feature names (case, gender, number) and their values
+    key = (c.NOUN, (c.CASE, c.GENDER, c.NUMBER, c.NOMINATIVE, c.MASCULINE, c.SINGULAR))
+    assert service._candidate_cache[key] == ["άνθρωπος"]
+
+
+def test_add_word_links_each_translation_once():
+    """Should strip translations and reuse existing English words."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person", " person", "human"], c.NOUN)
+    manager.add_word("πρόσωπο", ["person"], c.NOUN)
+
+    english = manager._conn.execute(
+        "SELECT word FROM english_words ORDER BY word"
+    ).fetchall()
+    links = manager._conn.execute(
+        "SELECT COUNT(*) FROM translations WHERE greek_lemma = ?", ("άνθρωπος",)
+    ).fetchone()[0]
+
+    assert [row[0] for row in english] == ["human", "person"]
+    assert links == 2
+
+
+def test_add_word_keeps_translation_order():
+    """Should read translations back in the order they were written."""
+    manager = Database()
+    manager.add_word("λέξη", ["word"], c.NOUN)
+    added = manager.add_word("άνθρωπος", ["person", "human", "word", "man"], c.NOUN)
+
+    result = manager._get_word_by_lemma("άνθρωπος", c.NOUN)
+
+    assert added.translations == ["person", "human", "word", "man"]
+    assert result.translations == ["person", "human", "word", "man"]
+
+
+def test_get_random_word_returns_independent_words_for_cached_lemma():
+    """Should reuse generated forms without sharing selected word state."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+
+    nominative = manager.get_random_word(
+        c.NOUN, gender=c.MASCULINE, number=c.SINGULAR, case=c.NOMINATIVE
+    )
+    genitive = manager.get_random_word(
+        c.NOUN, gender=c.MASCULINE, number=c.SINGULAR, case=c.GENITIVE
+    )
+
+    assert nominative is not genitive
+    assert nominative.forms is genitive.forms
+    assert nominative.case == c.NOMINATIVE
+    assert nominative.word != genitive.word
+
+
+def test_add_word_keeps_cached_candidates_of_other_lexicals():
+    """Should only drop the candidate lists of the lexical written to."""
+    manager = Database()
+    manager.add_word("πολύ", ["very"], c.ADVERB)
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+    manager.preload_candidates()
+
+    manager.add_word("δάσκαλος", ["teacher"], c.NOUN)
+
+    assert (c.ADVERB, ()) in manager._candidate_cache
+    assert not any(key[0] == c.NOUN for key in manager._candidate_cache)
+    noun = manager.get_random_word(
+        c.NOUN, gender=c.MASCULINE, number=c.SINGULAR, case=c.NOMINATIVE
+    )
+    assert noun.lemma in {"άνθρωπος", "δάσκαλος"}
+    assert (c.ADVERB, ()) in manager._candidate_cache
+
+
+def test_add_word_runs_check_and_inserts_in_one_transaction():
+    """Should take the write lock before the existence check and commit once."""
+    manager = Database()
+    statements = []
+    manager._conn.set_trace_callback(statements.append)
+
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+
+    begins = [i for i, sql in enumerate(statements) if sql.startswith("BEGIN")]
+    assert len(begins) == 1
+    assert statements[begins[0]] == "BEGIN IMMEDIATE"
+    assert statements[begins[0] + 1].startswith("SELECT id FROM greek_nouns")
+    assert statements.count("COMMIT") == 1
+
+
+def test_add_word_returns_word_without_reading_it_back():
+    """Should build the returned word from the inserted data."""
+    manager = Database()
+    statements = []
+    manager._conn.set_trace_callback(statements.append)
+
+    word = manager.add_word("άνθρωπος", ["person", " human", "person"], c.NOUN)
+
+    assert word.lemma == "άνθρωπος"
+    assert word.translations == ["person", "human"]
+    after_commit = statements[statements.index("COMMIT") + 1 :]
+    assert not any(sql.startswith("SELECT") for sql in after_commit)
+
+
+def test_add_word_releases_transaction_when_word_exists():
+    """Should roll back the write transaction when validation fails."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+
+    with pytest.raises(ValueError, match="already exists"):
+        manager.add_word("άνθρωπος", ["human"], c.NOUN)
+
+    assert not manager._conn.in_transaction
+
+
+def test_add_word_inflects_before_taking_write_lock(monkeypatch):
+    """Should run Morpheus outside the write transaction."""
+    manager = Database()
+    create = api.Morpheus.create
+    in_transaction = []
+
+    def record(lemma, lexical):
+        in_transaction.append(manager._conn.in_transaction)
+        return create(lemma, lexical)
+
+    api._inflect.cache_clear()
+    monkeypatch.setattr(api.Morpheus, "create", record)
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+
+    assert in_transaction == [False]
+
+
+def test_add_word_rejects_existing_lemma_before_inflecting(monkeypatch):
+    """Should not run Morpheus for a lemma that is already stored."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+    calls = []
+
+    def record(lemma, lexical):
+        calls.append(lemma)
+        raise AssertionError("Morpheus should not run")
+
+    api._inflect.cache_clear()
+    monkeypatch.setattr(api.Morpheus, "create", record)
+    with pytest.raises(ValueError, match="already exists"):
+        manager.add_word("άνθρωπος", ["human"], c.NOUN)
+
+    assert calls == []
+
+
+def test_add_word_leaves_caller_transaction_to_caller():
+    """Should neither commit nor roll back a transaction it did not open."""
+    manager = Database()
+    manager._conn.execute("BEGIN")
+
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+    assert manager._conn.in_transaction
+    with pytest.raises(ValueError, match="already exists"):
+        manager.add_word("άνθρωπος", ["human"], c.NOUN)
+    assert manager._conn.in_transaction
+
+    manager._conn.rollback()
+    assert manager.count_total_words() == 0
+
+
+def test_translation_links_require_existing_english_word():
+    """Should enforce the translations foreign key on the connection."""
+    manager = Database()
+
+    with pytest.raises(sqlite3.IntegrityError):
+        manager._conn.execute(
+            "INSERT INTO translations (english_word_id, greek_lemma, greek_lexical) "
+            "VALUES (?, ?, ?)",
+            (42, "άνθρωπος", c.NOUN),
+        )
+
+
 def test_add_word_raises_error_for_empty_translations():
     """Should raise ValueError when translations list is empty."""
     manager = Database()
@@ -182,7 +533,7 @@ def test_add_word_raises_error_for_duplicate_lemma():
     cursor = manager._conn.cursor()
     cursor.execute(
         "INSERT INTO greek_nouns (lemma, gender, number, [case], validation_status) VALUES (?, ?, ?, ?, ?)",
-        ("άνθρωπος", "masc", "sg", "nom", "VALID"),
+        ("άνθρωπος", "masc", "sg", "nom", c.VALIDATION_VALID),
     )
     manager._conn.commit()
 
@@ -222,7 +573,7 @@ def test_add_word_successfully_adds_noun_with_single_translation():
     assert rows[0][1] == "masc"  # Inferred from cases
     assert rows[0][2] in ["sg", "pl"]  # Has explicit number
     assert rows[0][3] in ["nom", "gen", "acc", "voc"]  # Has explicit case
-    assert rows[0][4] == "VALID"
+    assert rows[0][4] == c.VALIDATION_VALID
 
     # Check English word inserted
     eng_row = cursor.execute(
@@ -239,3 +590,216 @@ def test_add_word_successfully_adds_noun_with_single_translation():
     ).fetchone()
     assert trans_row is not None
     assert trans_row[0] == "άνθρωπος"
+
+
+def test_add_words_from_concurrent_threads_commits_every_batch():
+    """Should serialize writers sharing the connection."""
+    manager = Database()
+    batches = [
+        [("άνθρωπος", ["person"], c.NOUN), ("πολύ", ["very"], c.ADVERB)],
+        [("βλέπω", ["see"], c.VERB), ("και", ["and"], c.CONJUNCTION)],
+        [("δάσκαλος", ["teacher"], c.NOUN), ("γράφω", ["write"], c.VERB)],
+    ]
+    errors = []
+
+    def load(batch):
+        try:
+            manager.add_words(batch)
+        except Exception as e:  # pragma: no cover - surfaced by the assert
+            errors.append(e)
+
+    threads = [threading.Thread(target=load, args=(batch,)) for batch in batches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    lemmas = {
+        row[0]
+        for row in manager._conn.execute("SELECT DISTINCT greek_lemma FROM translations")
+    }
+    assert lemmas == {lemma for batch in batches for lemma, _, _ in batch}
+
+
+def test_lookups_inside_open_transaction_are_not_cached():
+    """Should not cache rows another thread's transaction may roll back."""
+    manager = Database()
+    manager._conn.execute("BEGIN")
+    manager._conn.execute(
+        "INSERT INTO greek_nouns (lemma, gender, number, [case]) VALUES (?, ?, ?, ?)",
+        ("άνθρωπος", c.MASCULINE, c.SINGULAR, c.NOMINATIVE),
+    )
+    features = {"gender": c.MASCULINE, "number": c.SINGULAR, "case": c.NOMINATIVE}
+    assert manager.get_random_word(c.NOUN, **features) is not None
+    assert manager.count_total_words() == 1
+
+    manager._conn.rollback()
+
+    assert manager.get_random_word(c.NOUN, **features) is None
+    assert manager.count_total_words() == 0
+    assert manager._translation_cache == {}
+
+
+def test_prepare_rows_fills_features_into_field_order():
+    """Should lay out each feature combination in the table's field order."""
+    manager = Database()
+    fields = c.LEXICAL_CONFIG[c.NOUN]["fields"]
+
+    rows = manager._prepare_rows(
+        "άνθρωπος",
+        c.NOUN,
+        [
+            {c.GENDER: c.MASCULINE, c.NUMBER: c.SINGULAR, c.CASE: c.NOMINATIVE},
+            {c.GENDER: c.MASCULINE, c.NUMBER: c.PLURAL, "unknown": "x"},
+        ],
+    )
+
+    assert len(rows) == 2
+    first, second = (dict(zip(fields, row)) for row in rows)
+    assert first["lemma"] == second["lemma"] == "άνθρωπος"
+    assert first["validation_status"] == c.VALIDATION_VALID
+    assert first[c.CASE] == c.NOMINATIVE
+    assert second[c.NUMBER] == c.PLURAL
+    assert second[c.CASE] is None
+
+
+def test_add_words_adds_all_words_in_one_batch():
+    """Should add every word and return how many were added."""
+    manager = Database()
+
+    count = manager.add_words(
+        [
+            ("άνθρωπος", ["person", "human"], c.NOUN),
+            ("βλέπω", ["see"], c.VERB),
+            ("και", ["and"], c.CONJUNCTION),
+        ],
+        batch_size=10,
+    )
+
+    assert count == 3
+    cursor = manager._conn.cursor()
+    for table in ["greek_nouns", "greek_verbs", "greek_conjunctions"]:
+        assert cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] > 0
+    translations = cursor.execute(
+        "SELECT COUNT(*) FROM translations WHERE greek_lemma = ?", ("άνθρωπος",)
+    ).fetchone()[0]
+    assert translations == 2
+
+
+def test_add_words_rolls_back_on_duplicate_in_batch():
+    """Should reject a lemma repeated within the batch and commit nothing."""
+    manager = Database()
+
+    with pytest.raises(ValueError) as exc_info:
+        manager.add_words(
+            [
+                ("άνθρωπος", ["person"], c.NOUN),
+                ("άνθρωπος", ["human"], c.NOUN),
+            ]
+        )
+
+    assert "already exists" in str(exc_info.value)
+    cursor = manager._conn.cursor()
+    assert cursor.execute("SELECT COUNT(*) FROM greek_nouns").fetchone()[0] == 0
+    assert cursor.execute("SELECT COUNT(*) FROM translations").fetchone()[0] == 0
+
+
+def test_add_words_skips_invalid_words_when_collecting_them():
+    """Should report bad words and still add the rest of the batch."""
+    manager = Database()
+    manager.add_word("άνθρωπος", ["person"], c.NOUN)
+    skipped = []
+
+    count = manager.add_words(
+        [
+            ("άνθρωπος", ["human"], c.NOUN),
+            ("βλέπω", ["see"], c.VERB),
+            ("και", [], c.CONJUNCTION),
+            ("βλέπω", ["look"], c.VERB),
+            ("ένα", ["one"], "bogus"),
+        ],
+        skipped=skipped,
+    )
+
+    assert count == 1
+    assert [(lemma, lexical) for lemma, lexical, _ in skipped] == [
+        ("άνθρωπος", c.NOUN),
+        ("και", c.CONJUNCTION),
+        ("βλέπω", c.VERB),
+        ("ένα", "bogus"),
+    ]
+    assert "already exists" in skipped[0][2]
+    assert skipped[3][2] == "Unsupported lexical 'bogus'"
+    assert manager._get_word_by_lemma("βλέπω", c.VERB).translations == ["see"]
+    assert manager._get_word_by_lemma("και", c.CONJUNCTION) is None
+    assert not manager._conn.in_transaction
+
+
+def test_database_enables_wal_for_file_databases(tmp_path):
+    """File databases should open in WAL mode with relaxed sync."""
+    manager = Database(str(tmp_path / "lexicon.db"))
+
+    journal_mode = manager._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    synchronous = manager._conn.execute("PRAGMA synchronous").fetchone()[0]
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+
+
+def test_database_maps_new_file_databases_with_large_pages(tmp_path):
+    """New file databases should use 8 KiB pages and memory-mapped reads."""
+    manager = Database(str(tmp_path / "lexicon.db"))
+
+    page_size = manager._conn.execute("PRAGMA page_size").fetchone()[0]
+    mmap_size = manager._conn.execute("PRAGMA mmap_size").fetchone()[0]
+
+    assert page_size == 8192
+    assert mmap_size == 268435456
+
+
+def test_bulk_mode_restores_pragmas_on_exit(tmp_path):
+    """bulk_mode should disable sync inside the block and restore it after."""
+    manager = Database(str(tmp_path / "lexicon.db"))
+
+    with manager.bulk_mode():
+        assert manager._conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+
+    assert manager._conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert manager._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_page_cache_is_sized_for_file_databases_only(tmp_path):
+    """Should give file databases a 64 MiB page cache and leave :memory: alone."""
+    file_db = Database(str(tmp_path / "lexicon.db"))
+    memory_db = Database()
+    default = sqlite3.connect(":memory:").execute("PRAGMA cache_size").fetchone()[0]
+
+    assert file_db._conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    assert memory_db._conn.execute("PRAGMA cache_size").fetchone()[0] == default
+
+
+def test_insert_rows_packs_rows_into_multi_row_statements():
+    """Should insert every row when rows span several packed statements."""
+    manager = Database()
+    rows = [
+        [f"λέξη{i}", c.MASCULINE, c.SINGULAR, c.NOMINATIVE, c.VALIDATION_VALID]
+        for i in range(450)  # 199 rows per statement -> 2 full chunks + 52 rows
+    ]
+
+    manager._insert_rows(manager._conn.cursor(), c.NOUN, rows)
+
+    count = manager._conn.execute("SELECT COUNT(*) FROM greek_nouns").fetchone()[0]
+    assert count == 450
+
+
+def test_insert_rows_or_ignore_counts_only_new_rows():
+    """Should skip duplicate rows and report how many were inserted."""
+    manager = Database()
+    columns = ("word", "lexical")
+    rows = [(f"word{i}", c.NOUN) for i in range(1200)]
+    cursor = manager._conn.cursor()
+
+    assert api.insert_rows(cursor, "english_words", columns, rows[:700]) == 700
+    inserted = api.insert_rows(cursor, "english_words", columns, rows, or_ignore=True)
+    assert inserted == 500
@@ -1,3 +1,4 @@
+import re
 import sqlite3
 
 import pytest
@@ -5,6 +6,15 @@ import pytest
 from syntaxis.lib.database.schema import create_schema
 
 
+def _uses_index(plan, index):
+    # Matches "USING INDEX x" and "USING COVERING INDEX x" on any SQLite version
+    return re.search(rf"USING (COVERING )?INDEX {index}\b", plan) is not None
+
+
+def _scans_table(plan, table):
+    return re.search(rf"SCAN (TABLE )?{table}\b", plan) is not None
+
+
 def test_schema_creates_greek_nouns_with_bitmask_columns():
     """greek_nouns table should have feature columns (gender, number, case)."""
     conn = sqlite3.connect(":memory:")
@@ -102,6 +112,164 @@ def test_schema_creates_greek_pronouns_with_bitmask_columns():
     assert columns["person"] == "TEXT"
 
 
+def test_schema_creates_feature_indexes():
+    """Feature filter queries should be answered from a composite index."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA index_info(ix_greek_nouns_features)")
+    columns = [row[2] for row in cursor.fetchall()]
+    assert columns == ["gender", "number", "case", "lemma"]
+
+    plan = cursor.execute(
+        "EXPLAIN QUERY PLAN SELECT DISTINCT lemma FROM greek_nouns "
+        "WHERE gender = ? AND number = ? AND [case] = ?",
+        ("masc", "sg", "nom"),
+    ).fetchall()
+    detail = "\n".join(row[3] for row in plan)
+    assert _uses_index(detail, "ix_greek_nouns_features")
+    assert not _scans_table(detail, "greek_nouns")
+
+
+def test_pronoun_feature_index_serves_filters_without_gender():
+    """Pronoun lookups that leave gender unset should still seek the index."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT DISTINCT lemma FROM greek_pronouns "
+        "WHERE type = ? AND person = ? AND number = ? AND [case] = ?",
+        ("personal_strong", "pri", "sg", "nom"),
+    ).fetchall()
+    detail = "\n".join(row[3] for row in plan)
+    assert _uses_index(detail, "ix_greek_pronouns_features")
+    assert not _scans_table(detail, "greek_pronouns")
+
+
+def test_create_schema_rebuilds_feature_index_with_old_column_order():
+    """An existing feature index with a stale column order should be rebuilt."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    conn.execute("DROP INDEX ix_greek_pronouns_features")
+    conn.execute(
+        "CREATE INDEX ix_greek_pronouns_features ON greek_pronouns "
+        "(type, person, gender, number, [case], lemma)"
+    )
+
+    create_schema(conn)
+
+    columns = [
+        row[2] for row in conn.execute("PRAGMA index_info(ix_greek_pronouns_features)")
+    ]
+    assert columns == ["type", "person", "number", "case", "gender", "lemma"]
+
+
+def test_create_schema_merges_duplicate_english_words():
+    """Existing duplicate English words should be merged before indexing."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    # Simulate a database created before the unique index existed
+    conn.execute("DROP INDEX ux_english_words_word_lexical")
+    conn.executemany(
+        "INSERT INTO english_words (word, lexical) VALUES (?, ?)",
+        [("the", "article"), ("the", "article"), ("he", "pronoun")],
+    )
+    conn.executemany(
+        "INSERT INTO translations (english_word_id, greek_lemma, greek_lexical) "
+        "VALUES (?, ?, ?)",
+        [(1, "ο", "article"), (2, "ο", "article"), (2, "η", "article")],
+    )
+
+    create_schema(conn)
+
+    words = conn.execute("SELECT id, word FROM english_words ORDER BY id").fetchall()
+    assert words == [(1, "the"), (3, "he")]
+    links = conn.execute(
+        "SELECT english_word_id, greek_lemma FROM translations ORDER BY greek_lemma"
+    ).fetchall()
+    assert links == [(1, "η"), (1, "ο")]
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute(
+            "INSERT INTO english_words (word, lexical) VALUES ('he', 'pronoun')"
+        )
+
+
+def test_schema_stores_validation_status_as_integer():
+    """validation_status should be a small integer code defaulting to valid."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+
+    columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(greek_nouns)")}
+    assert columns["validation_status"] == "INTEGER"
+
+    conn.execute("INSERT INTO greek_adverbs (lemma) VALUES ('πολύ')")
+    status = conn.execute("SELECT validation_status FROM greek_adverbs").fetchone()[0]
+    assert status == 0
+
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute(
+            "INSERT INTO greek_adverbs (lemma, validation_status) "
+            "VALUES ('καλά', 'VALID')"
+        )
+
+
+def test_create_schema_migrates_text_validation_status():
+    """Tables with the old TEXT validation_status should be rebuilt as INTEGER."""
+    conn = sqlite3.connect(":memory:")
+    # Simulate a database created before validation_status became an integer
+    conn.executescript(
+        """
+        CREATE TABLE greek_articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            lemma TEXT NOT NULL,
+            type TEXT NOT NULL,
+            gender TEXT,
+            number TEXT,
+            [case] TEXT,
+            validation_status TEXT NOT NULL,
+            UNIQUE(lemma, gender, number, [case])
+        );
+        CREATE TABLE greek_adverbs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            lemma TEXT NOT NULL UNIQUE,
+            validation_status TEXT NOT NULL
+        );
+        INSERT INTO greek_articles (id, lemma, type, gender, number, [case],
+            validation_status)
+        VALUES (3, 'ο', 'definite', 'masc', 'sg', 'nom', 'validated'),
+               (7, 'ο', 'definite', 'fem', 'sg', 'nom', 'VALID');
+        INSERT INTO greek_adverbs (lemma, validation_status)
+        VALUES ('πολύ', '0'), ('καλά', 'pending');
+        """
+    )
+
+    create_schema(conn)
+
+    columns = {
+        row[1]: row[2] for row in conn.execute("PRAGMA table_info(greek_articles)")
+    }
+    assert columns["validation_status"] == "INTEGER"
+    articles = conn.execute(
+        "SELECT id, gender, validation_status FROM greek_articles ORDER BY id"
+    ).fetchall()
+    assert articles == [(3, "masc", 0), (7, "fem", 0)]
+    adverbs = conn.execute(
+        "SELECT lemma, validation_status FROM greek_adverbs ORDER BY id"
+    ).fetchall()
+    assert adverbs == [("πολύ", 0), ("καλά", 1)]
+
+    # Rows without an explicit status are accepted again and indexes are back
+    conn.execute(
+        "INSERT INTO greek_articles (lemma, type, gender, number, [case]) "
+        "VALUES ('ο', 'definite', 'neut', 'sg', 'nom')"
+    )
+    index = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'ix_greek_articles_features'"
+    ).fetchone()
+    assert index is not None
+
+
 def test_create_schema_creates_templates_table():
     """Should create templates table with correct schema."""
     conn = sqlite3.connect(":memory:")
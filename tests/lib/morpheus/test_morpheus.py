@@ -1,3 +1,5 @@
+import pytest
+
 from syntaxis.lib import constants as c
 from syntaxis.lib.models.lexical import Adjective, Article, Noun, Verb
 from syntaxis.lib.morpheus import Morpheus
@@ -36,3 +38,9 @@ def test_morpheus_create_populates_forms():
     result = Morpheus.create("άνθρωπος", c.NOUN)
     assert result.forms is not None
     assert len(result.forms) > 0
+
+
+def test_morpheus_create_raises_key_error_for_unknown_lexical():
+    """create() should reject lexicals without a factory."""
+    with pytest.raises(KeyError):
+        Morpheus.create("άνθρωπος", "unknown")
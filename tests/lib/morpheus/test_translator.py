@@ -40,3 +40,15 @@ def test_translate_forms_mixed_keys():
 def test_translate_forms_empty_dict():
     """Test translation of an empty dictionary."""
     assert translate_forms({}) == {}
+
+
+def test_translate_forms_preserves_sibling_order():
+    """Test that translated dictionaries keep the source key order."""
+    input_dict = {
+        resources.SG: {resources.NOM: {"a"}, resources.GEN: {"b"}},
+        resources.PL: {resources.ACC: {"c"}, resources.NOM: {"d"}},
+    }
+    result = translate_forms(input_dict)
+    assert list(result) == [c.SINGULAR, c.PLURAL]
+    assert list(result[c.SINGULAR]) == [c.NOMINATIVE, c.GENITIVE]
+    assert list(result[c.PLURAL]) == [c.ACCUSATIVE, c.NOMINATIVE]
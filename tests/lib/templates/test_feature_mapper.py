@@ -45,3 +45,11 @@ class TestFeatureMapper:
         """Unknown features should raise ValueError"""
         with pytest.raises(ValueError, match="Unknown feature"):
             FeatureMapper.get_category("invalid")
+
+    def test_prefix_lookup_is_memoized(self):
+        """Repeated prefix lookups should return the cached expansion"""
+        first = FeatureMapper.get_category("pres")
+        hits_before = FeatureMapper.get_category.cache_info().hits
+
+        assert FeatureMapper.get_category("pres") == first == (c.PRESENT, c.TENSE)
+        assert FeatureMapper.get_category.cache_info().hits == hits_before + 1